@@ -0,0 +1,21 @@
+# backend/app/commands/reconcile_counters.py
+"""Fix drift in the denormalized course counters.
+
+Usage: python -m app.commands.reconcile_counters [course_id ...]
+"""
+from app.core.database import get_db_session
+from app.services.counters import reconcile_course_counters
+import sys
+
+
+def main(course_ids=None):
+    with get_db_session() as session:
+        fixed = reconcile_course_counters(session, course_ids)
+        session.commit()
+
+    print(f"✅ Course counters reconciled: {fixed} course(s) corrected")
+    return fixed
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or None)
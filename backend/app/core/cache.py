@@ -0,0 +1,434 @@
+# backend/app/core/cache.py
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import Session
+from app.core.config import settings
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+import asyncio
+import logging
+import os
+import select as select_module
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+# NOTIFY payloads must stay below 8000 bytes
+MAX_NOTIFY_PAYLOAD = 7000
+
+# Every TTLCache registers itself so tag invalidations reach all of them
+_caches: List["TTLCache"] = []
+
+# Per cache, how many recently invalidated tags are remembered for the
+# write-back check in TTLCache.set (older reads are simply not stored)
+MAX_TRACKED_INVALIDATIONS = 10000
+
+
+class TTLCache:
+    """Thread-safe bounded LRU cache with per-entry TTL and tag invalidation.
+
+    Entries are tagged (e.g. "course:<id>") when stored, and `invalidate_tags`
+    drops every entry carrying one of the given tags. Hit/miss/eviction
+    counters are kept for `/api/cache/stats`.
+
+    A value read from the database can be outdated by the time it is stored,
+    if a write committed (and its invalidation arrived) in between. Take
+    `generation()` before the read and pass it to `set()`: the value is then
+    dropped instead of stored when any of its tags was invalidated since.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+        # Reentrant so subclasses can call set()/invalidate_tags() under it
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stale_sets = 0
+        # Bumped on every invalidation; tag -> generation it was last
+        # invalidated at, oldest first. Reads from before `_forgotten`
+        # can't be checked any more and are treated as stale.
+        self._generation = 0
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._forgotten = 0
+        _caches.append(self)
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, tags: Iterable[str] = (),
+            ttl: Optional[float] = None, generation: Optional[int] = None):
+        tags = frozenset(tags)
+        with self._lock:
+            if generation is not None and self._invalidated_since(tags, generation):
+                self.stale_sets += 1
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (
+                value, time.monotonic() + (ttl or self.ttl), tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate_tags(self, tags: Iterable[str]):
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                self._invalidated[tag] = self._generation
+                self._invalidated.move_to_end(tag)
+                for key in self._tags.pop(tag, ()):
+                    if key in self._entries:
+                        self._remove(key)
+                        self.invalidations += 1
+            while len(self._invalidated) > MAX_TRACKED_INVALIDATIONS:
+                _, self._forgotten = self._invalidated.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            # Everything may have changed: no read in flight may be stored
+            self._generation += 1
+            self._invalidated.clear()
+            self._forgotten = self._generation
+
+    def _invalidated_since(self, tags: frozenset, generation: int) -> bool:
+        # Caller holds the lock
+        if generation < self._forgotten:
+            return True
+        return any(self._invalidated.get(tag, 0) > generation for tag in tags)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "stale_sets": self.stale_sets,
+            }
+
+    def _remove(self, key: str):
+        # Caller holds the lock
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class StaleWhileRevalidateCache(TTLCache):
+    """TTLCache for expensive values that may be served slightly out of date.
+
+    `get_or_compute` returns a value as soon as one is cached. Once it is
+    older than `ttl`, the stale value is still returned while a background
+    thread recomputes it; only after `ttl + max_stale` (or a tag
+    invalidation) does a caller have to wait for a computation. Concurrent
+    callers missing the same key share one computation. `compute` runs on a
+    pool thread, so it must open its own database session; async routes use
+    `get_or_compute_async` and close their request session first.
+
+    An invalidation also cancels the storing of computations already in
+    flight for the tag, so a value read before a write can't be cached after
+    it.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float, max_stale: float,
+                 refresh_workers: int = 2):
+        super().__init__(name, maxsize, ttl + max_stale)
+        self.fresh_ttl = ttl
+        self.max_stale = max_stale
+        # key -> (future of the running computation, tags it will be stored with)
+        self._inflight: Dict[str, Tuple[Future, frozenset]] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=refresh_workers, thread_name_prefix=f"{name}-refresh")
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.coalesced = 0
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       tags: Iterable[str] = ()) -> Any:
+        """Blocking variant, for threads (sync routes, scripts)"""
+        tags = frozenset(tags)
+        found, value = self._lookup(key, compute, tags)
+        if found:
+            return value
+
+        future, owner = self._claim(key, tags)
+        if owner:
+            self._compute(key, compute, tags, future)
+        return future.result()
+
+    async def get_or_compute_async(self, key: str, compute: Callable[[], Any],
+                                   tags: Iterable[str] = ()) -> Any:
+        """For async routes: the event loop never runs or waits on `compute`.
+
+        A miss computes on the threadpool (like a sync route would), and
+        callers missing a key that is already being computed await the same
+        future instead of blocking.
+        """
+        tags = frozenset(tags)
+        found, value = self._lookup(key, compute, tags)
+        if found:
+            return value
+
+        future, owner = self._claim(key, tags)
+        if owner:
+            await run_in_threadpool(self._compute, key, compute, tags, future)
+        return await asyncio.wrap_future(future)
+
+    def _lookup(self, key: str, compute: Callable[[], Any],
+                tags: frozenset) -> Tuple[bool, Any]:
+        """Cached value if any, scheduling a background refresh when stale"""
+        entry = self.get(key)
+        if entry is None:
+            return False, None
+
+        value, fresh_until = entry
+        if fresh_until <= time.monotonic():
+            with self._lock:
+                self.stale_hits += 1
+            future, owner = self._claim(key, tags, refresh=True)
+            if owner:
+                self._executor.submit(self._compute, key, compute, tags, future)
+        return True, value
+
+    def _claim(self, key: str, tags: frozenset,
+               refresh: bool = False) -> Tuple[Future, bool]:
+        """The future of `key`'s computation, and whether the caller must run it"""
+        with self._lock:
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                if not refresh:
+                    self.coalesced += 1
+                return inflight[0], False
+
+            if refresh:
+                self.refreshes += 1
+            else:
+                # Stored by another caller since our lookup
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > time.monotonic():
+                    done = Future()
+                    done.set_result(entry[0][0])
+                    return done, False
+
+            future = Future()
+            self._inflight[key] = (future, tags)
+            return future, True
+
+    def _compute(self, key: str, compute: Callable[[], Any], tags: frozenset,
+                 future: Future):
+        try:
+            value = compute()
+        except Exception as e:
+            with self._lock:
+                if self._inflight.get(key, (None,))[0] is future:
+                    del self._inflight[key]
+            logger.warning(f"{self.name} cache: computing {key} failed: {e}")
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            # Not ours any more if a tag invalidation came in meanwhile
+            if self._inflight.get(key, (None,))[0] is future:
+                del self._inflight[key]
+                self.set(key, (value, time.monotonic() + self.fresh_ttl), tags)
+        future.set_result(value)
+
+    def invalidate_tags(self, tags: Iterable[str]):
+        tags = set(tags)
+        with self._lock:
+            for key in [key for key, (_, key_tags) in self._inflight.items()
+                        if key_tags & tags]:
+                del self._inflight[key]
+            super().invalidate_tags(tags)
+
+    def clear(self):
+        with self._lock:
+            self._inflight.clear()
+            super().clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = super().stats()
+            stats.update(
+                ttl=self.fresh_ttl,
+                max_stale=self.max_stale,
+                stale_hits=self.stale_hits,
+                refreshes=self.refreshes,
+                coalesced=self.coalesced,
+                computing=len(self._inflight),
+            )
+            return stats
+
+
+def cache_key(namespace: str, **params) -> str:
+    """Stable key for a route + query: None params dropped, the rest sorted"""
+    items = sorted((k, str(v)) for k, v in params.items() if v is not None)
+    return f"{namespace}?{urlencode(items)}" if items else namespace
+
+
+catalog_cache = TTLCache(
+    "catalog", settings.CATALOG_CACHE_SIZE, settings.CATALOG_CACHE_TTL)
+
+
+# Invalidation
+#
+# Writers call `invalidate(session, *tags)` before committing. The tags are
+# dropped from this worker's caches once the transaction commits, and on
+# Postgres a NOTIFY is queued in the same transaction so every other gunicorn
+# worker (each running `start_invalidation_listener`) drops them too - only if
+# the write actually commits.
+
+
+def invalidate_local(tags: Iterable[str]):
+    tags = list(tags)
+    for cache in _caches:
+        cache.invalidate_tags(tags)
+
+
+def invalidate(session: Session, *tags: str):
+    """Invalidate cache tags when `session` commits (all workers)"""
+    if not tags:
+        return
+
+    session.info.setdefault("cache_invalidations", set()).update(tags)
+
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            [
+                {"channel": INVALIDATION_CHANNEL, "payload": payload}
+                for payload in _notify_payloads(tags)
+            ]
+        )
+
+
+def _notify_payloads(tags: Iterable[str]) -> List[str]:
+    """Split tags into space-separated NOTIFY payloads under Postgres' limit"""
+    payloads, current, size = [], [], 0
+    for tag in tags:
+        if current and size + len(tag) + 1 > MAX_NOTIFY_PAYLOAD:
+            payloads.append(" ".join(current))
+            current, size = [], 0
+        current.append(tag)
+        size += len(tag) + 1
+    if current:
+        payloads.append(" ".join(current))
+    return payloads
+
+
+@event.listens_for(SASession, "after_commit")
+def _apply_invalidations(session):
+    tags = session.info.pop("cache_invalidations", None)
+    if tags:
+        invalidate_local(tags)
+
+
+@event.listens_for(SASession, "after_rollback")
+def _discard_invalidations(session):
+    session.info.pop("cache_invalidations", None)
+
+
+def _listen_for_invalidations(engine):
+    """Worker thread: apply NOTIFY payloads from other processes forever"""
+    while True:
+        connection = None
+        try:
+            connection = engine.raw_connection()
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.autocommit = True
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {INVALIDATION_CHANNEL}")
+
+            # Anything may have changed while we weren't listening
+            for cache in _caches:
+                cache.clear()
+
+            while True:
+                ready, _, _ = select_module.select(
+                    [dbapi_connection], [], [], 30)
+                if not ready:
+                    continue
+                dbapi_connection.poll()
+                while dbapi_connection.notifies:
+                    notify = dbapi_connection.notifies.pop(0)
+                    invalidate_local(notify.payload.split())
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener error: {e}")
+            time.sleep(5)
+        finally:
+            if connection is not None:
+                try:
+                    connection.invalidate()
+                except Exception:
+                    pass
+
+
+def start_invalidation_listener(engine):
+    """Start the per-worker NOTIFY listener (Postgres only; SQLite runs single-process)"""
+    if engine.dialect.name != "postgresql":
+        return
+
+    thread = threading.Thread(
+        target=_listen_for_invalidations,
+        args=(engine,),
+        name="cache-invalidation-listener",
+        daemon=True
+    )
+    thread.start()
+
+
+def cache_stats() -> Dict[str, Any]:
+    return {
+        "pid": os.getpid(),
+        "caches": {cache.name: cache.stats() for cache in _caches},
+    }
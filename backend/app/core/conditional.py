@@ -0,0 +1,137 @@
+# backend/app/core/conditional.py
+from fastapi import HTTPException, Request, Response, status
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Tuple
+import hashlib
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from the values that determine a representation"""
+    digest = hashlib.sha256(
+        "\x1f".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def http_date(value: datetime) -> str:
+    # Timestamps are stored as naive UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function
+    candidates = (tag.strip() for tag in header.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since for a GET request.
+
+    If-None-Match wins when both are sent (RFC 9110 §13.2.2).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        modified = last_modified.replace(
+            tzinfo=last_modified.tzinfo or timezone.utc, microsecond=0)
+        return modified <= since
+
+    return False
+
+
+def validator_headers(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    private: bool = False
+) -> dict:
+    headers = {
+        "ETag": etag,
+        # Clients may store the response but must revalidate every time
+        "Cache-Control": f"{'private' if private else 'public'}, no-cache",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    private: bool = False
+) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified, private)
+    )
+
+
+def parse_range(
+    request: Request,
+    size: int,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> Optional[Tuple[int, int]]:
+    """Resolve a single `Range: bytes=...` request to an inclusive (start, end).
+
+    Returns None when the whole representation should be sent: no Range
+    header, an If-Range that no longer matches, or a multi-range/malformed
+    header (which servers may ignore). Raises 416 when the range cannot be
+    satisfied.
+    """
+    header = request.headers.get("range")
+    if not header:
+        return None
+
+    if_range = request.headers.get("if-range")
+    if if_range is not None:
+        # If-Range requires the strong comparison function
+        if if_range.startswith('"'):
+            if if_range.strip() != etag:
+                return None
+        elif last_modified is None or if_range.strip() != http_date(last_modified):
+            return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep or not (first or last):
+        return None
+    if (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        start, end = max(size - int(last), 0), size - 1
+        if int(last) == 0:
+            start = size
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+
+    if start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
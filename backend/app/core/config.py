@@ -36,6 +36,25 @@ class Settings(BaseSettings):
     # Debug mode
     DEBUG: bool = True
 
+    # Catalog response cache (per worker, invalidated across workers)
+    CATALOG_CACHE_SIZE: int = 1024
+    CATALOG_CACHE_TTL: int = 300
+
+    # Per-user lesson access cache (enrolled/owned course ids)
+    ACCESS_CACHE_SIZE: int = 4096
+    ACCESS_CACHE_TTL: int = 60
+
+    # Instructor dashboard/analytics cache: fresh for TTL seconds, then served
+    # stale (refreshed in the background) for up to MAX_STALE more
+    ANALYTICS_CACHE_SIZE: int = 1024
+    ANALYTICS_CACHE_TTL: int = 60
+    ANALYTICS_CACHE_MAX_STALE: int = 600
+
+    # Buffer progress reports in memory and write them in batches (opt-in)
+    PROGRESS_BUFFER_ENABLED: bool = False
+    PROGRESS_FLUSH_INTERVAL: float = 5.0
+    PROGRESS_FLUSH_MAX_PENDING: int = 1000
+
     #Claudinary settings
     CLOUDINARY_CLOUD_NAME: str = ""
     CLOUDINARY_API_KEY: str = ""
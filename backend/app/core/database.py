@@ -1,5 +1,6 @@
 # backend/app/core/database.py
 from sqlmodel import  create_engine, Session
+from sqlalchemy.dialects import postgresql, sqlite
 from app.core.config import settings
 import logging
 
@@ -31,3 +32,8 @@ def get_db_session():
     return Session(engine)
 
 
+def dialect_insert(session: Session, model):
+    """INSERT for the session's database, with on_conflict_do_* support"""
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
@@ -0,0 +1,111 @@
+# backend/app/core/pagination.py
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+import base64
+import json
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(
+    created_at: datetime,
+    row_id: str,
+    sort: Optional[str] = None
+) -> str:
+    """Opaque cursor pointing just after the (created_at, id) of the last row.
+
+    Endpoints with several orderings pass the `sort` the page was built with;
+    it is carried in the cursor so it can't be replayed against another one.
+    """
+    payload = [created_at.isoformat(), row_id]
+    if sort is not None:
+        payload.append(sort)
+    raw = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str,
+    sort: Optional[str] = None
+) -> Tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor.
+
+    400 if it was tampered with or issued for a different `sort`.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id, *cursor_sort = json.loads(
+            base64.urlsafe_b64decode(padded))
+        created_at, row_id = datetime.fromisoformat(created_at), str(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    if cursor_sort != ([] if sort is None else [sort]):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor was issued for a different sort order"
+        )
+    return created_at, row_id
+
+
+def keyset_paginate(
+    query,
+    created_at_column,
+    id_column,
+    limit: Optional[int],
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    sort: Optional[str] = None
+):
+    """Order newest first on (created_at, id) and seek past `cursor`.
+
+    The row-value comparison lets the composite (created_at, id) indexes serve
+    any page in constant time. Without a cursor, `skip` is still honoured so
+    older clients keep working. One extra row is fetched to detect whether a
+    next page exists (see `split_page`). `sort` must match the one given to
+    `split_page` when the cursor was issued.
+    """
+    query = query.order_by(created_at_column.desc(), id_column.desc())
+
+    if cursor:
+        created_at, row_id = decode_cursor(cursor, sort)
+        query = query.where(
+            tuple_(created_at_column, id_column) < tuple_(created_at, row_id))
+    elif skip:
+        query = query.offset(skip)
+
+    if limit is not None:
+        query = query.limit(limit + 1)
+
+    return query
+
+
+def split_page(
+    rows: List[Any],
+    limit: Optional[int],
+    key,
+    sort: Optional[str] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """Trim the look-ahead row and build the cursor for the following page.
+
+    `key` maps a row to its (created_at, id) pair; `sort` names the ordering
+    for endpoints that offer more than one.
+    """
+    if limit is None or len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor(*key(rows[-1]), sort=sort)
+
+
+def next_cursor_headers(next_cursor: Optional[str]) -> dict:
+    """Expose the next page cursor without changing the list response body"""
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]):
+    response.headers.update(next_cursor_headers(next_cursor))
@@ -0,0 +1,43 @@
+# backend/app/core/responses.py
+from fastapi import Response
+from pydantic import TypeAdapter
+from functools import lru_cache
+from typing import Any, Optional
+
+
+@lru_cache(maxsize=None)
+def type_adapter(type_) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
+def dump_json(content: Any, type_) -> bytes:
+    """Serialize straight to JSON bytes with pydantic-core (no re-validation)"""
+    return type_adapter(type_).dump_json(content)
+
+
+def json_bytes_response(
+    body: bytes,
+    status_code: int = 200,
+    headers: Optional[dict] = None
+) -> Response:
+    """Wrap already-serialized JSON.
+
+    Returning a Response makes FastAPI skip `response_model` validation and
+    `jsonable_encoder`; the route keeps `response_model` for the OpenAPI docs.
+    """
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
+
+
+def json_response(
+    content: Any,
+    type_,
+    status_code: int = 200,
+    headers: Optional[dict] = None
+) -> Response:
+    """Serialize trusted data once, directly to bytes, and wrap it"""
+    return json_bytes_response(dump_json(content, type_), status_code, headers)
@@ -1,7 +1,12 @@
 # backend/app/main.py
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.cache import start_invalidation_listener, cache_stats
+from app.core.database import engine
+from app.auth.dependencies import require_admin
+from app.services.progress import progress_buffer
 from app.routers import auth, courses, enrollments, categories, instructor, admin
 # Alembic imports for migration check
 from alembic.config import Config
@@ -26,6 +31,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include routers
@@ -61,6 +67,25 @@ def check_migrations():
         print("✅ Database is up to date with latest migrations.")
 
 
+# Keep per-worker caches coherent with writes made by other workers
+@app.on_event("startup")
+def start_cache_invalidation():
+    start_invalidation_listener(engine)
+
+
+# Batched progress writes (PROGRESS_BUFFER_ENABLED)
+@app.on_event("startup")
+def start_progress_buffer():
+    if settings.PROGRESS_BUFFER_ENABLED:
+        progress_buffer.start()
+
+
+@app.on_event("shutdown")
+def flush_progress_buffer():
+    if settings.PROGRESS_BUFFER_ENABLED:
+        progress_buffer.stop()
+
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -89,6 +114,12 @@ async def health_check():
     }
 
 
+# Cache statistics (per worker process, admins only)
+@app.get("/api/cache/stats", dependencies=[Depends(require_admin)])
+async def get_cache_stats():
+    return cache_stats()
+
+
 # API info endpoint
 @app.get("/api/info")
 async def api_info():
@@ -4,7 +4,9 @@ from .base import TimestampMixin
 from .user import User
 from .profile import Profile
 from .course import Course
+from .course_daily_stats import CourseDailyStats
 from .lesson import Lesson
+from .lesson_completion import LessonCompletion
 from .enrollment import Enrollment
 from .review import Review
 from .category import Category
@@ -16,7 +18,9 @@ __all__ = [
     "User",
     "Profile",
     "Course",
+    "CourseDailyStats",
     "Lesson",
+    "LessonCompletion",
     "Enrollment",
     "Review",
     "Category",
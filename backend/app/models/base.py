@@ -9,5 +9,6 @@ class TimestampMixin:
         default_factory=datetime.utcnow, nullable=False
     )
     updated_at: Optional[datetime] = Field(
-        default_factory=datetime.utcnow, nullable=False
+        default_factory=datetime.utcnow, nullable=False,
+        sa_column_kwargs={"onupdate": datetime.utcnow}
     )
@@ -1,9 +1,10 @@
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List
 import uuid
+from .base import TimestampMixin
 
 
-class Category(SQLModel, table=True):
+class Category(SQLModel, TimestampMixin, table=True):
     id: Optional[str] = Field(
         default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     name: str = Field(unique=True, index=True)
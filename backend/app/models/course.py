@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, List
 import uuid
 from .base import TimestampMixin
@@ -16,9 +17,28 @@ class Course(SQLModel, TimestampMixin, table=True):
     instructor_id: str = Field(foreign_key="user.id")
     category_id: Optional[str] = Field(default=None, foreign_key="category.id")
 
+    # Denormalized counters, maintained by app.services.counters
+    lessons_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    enrollments_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    rating_sum: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    rating_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
     instructor: Optional["User"] = Relationship(back_populates="courses")
     category: Optional["Category"] = Relationship(back_populates="courses")
     lessons: List["Lesson"] = Relationship(
         back_populates="course", cascade_delete=True)
     enrollments: List["Enrollment"] = Relationship(back_populates="course")
     reviews: List["Review"] = Relationship(back_populates="course")
+
+    __table_args__ = (
+        # Keyset pagination of the catalog, newest first
+        Index("ix_course_is_published_created_at_id",
+              "is_published", "created_at", "id"),
+        Index("ix_course_created_at_id", "created_at", "id"),
+        # Facet counts and filtered listings (index-only grouped scans)
+        Index("ix_course_is_published_category_id",
+              "is_published", "category_id"),
+        Index("ix_course_is_published_instructor_id",
+              "is_published", "instructor_id"),
+        Index("ix_course_is_published_price", "is_published", "price"),
+    )
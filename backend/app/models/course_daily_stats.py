@@ -0,0 +1,18 @@
+from sqlmodel import SQLModel, Field
+from datetime import date
+
+
+class CourseDailyStats(SQLModel, table=True):
+    # Per-course, per-day (UTC) activity counts backing the analytics time
+    # series. Rows are only ever incremented, by app.services.daily_stats,
+    # in the same transaction as the write being counted.
+    course_id: str = Field(
+        foreign_key="course.id", primary_key=True, ondelete="CASCADE")
+    day: date = Field(primary_key=True)
+
+    new_enrollments: int = Field(default=0)
+    unenrollments: int = Field(default=0)
+    # Enrollments reaching 100% progress for the first time
+    completions: int = Field(default=0)
+    review_count: int = Field(default=0)
+    review_sum: int = Field(default=0)
@@ -1,5 +1,7 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional
+from datetime import datetime
 import uuid
 from .base import TimestampMixin
 
@@ -11,7 +13,29 @@ class Enrollment(SQLModel, TimestampMixin, table=True):
     student_id: str = Field(foreign_key="user.id")
     course_id: str = Field(foreign_key="course.id")
 
+    # Denormalized count of lesson_completion rows, maintained by
+    # app.services.completions
+    completed_lessons_count: int = Field(
+        default=0, sa_column_kwargs={"server_default": "0"})
+    # When progress first reached 100; set once, even if progress is later
+    # reported lower again
+    completed_at: Optional[datetime] = Field(default=None)
+
     student: Optional["User"] = Relationship(back_populates="enrollments")
     course: Optional["Course"] = Relationship(back_populates="enrollments")
 
-    __table_args__ = ({"sqlite_autoincrement": True},)
+    __table_args__ = (
+        # One enrollment per student and course; enroll relies on it for
+        # ON CONFLICT DO NOTHING
+        Index("uq_enrollment_student_id_course_id",
+              "student_id", "course_id", unique=True),
+        # Keyset pagination for "my enrollments" and course rosters
+        Index("ix_enrollment_student_id_created_at_id",
+              "student_id", "created_at", "id"),
+        Index("ix_enrollment_course_id_created_at_id",
+              "course_id", "created_at", "id"),
+        # "My enrollments" sorted by last activity
+        Index("ix_enrollment_student_id_updated_at_id",
+              "student_id", "updated_at", "id"),
+        {"sqlite_autoincrement": True},
+    )
@@ -1,16 +1,18 @@
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Column
 from typing import Optional
 import uuid
 from .base import TimestampMixin
+from .types import CompressedText
 
 
 class Lesson(SQLModel, TimestampMixin, table=True):
     id: Optional[str] = Field(
         default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     title: str
-    content: str
+    # Stored compressed; see app/models/types.py
+    content: str = Field(sa_column=Column(CompressedText, nullable=False))
     video_url: Optional[str] = None
     order: int = Field(ge=1)
-    course_id: str = Field(foreign_key="course.id")
+    course_id: str = Field(foreign_key="course.id", index=True)
 
     course: Optional["Course"] = Relationship(back_populates="lessons")
@@ -0,0 +1,11 @@
+from sqlmodel import SQLModel, Field
+from .base import TimestampMixin
+
+
+class LessonCompletion(SQLModel, TimestampMixin, table=True):
+    # One row per completed lesson of an enrollment; the composite key makes
+    # repeated "complete" calls a no-op (ON CONFLICT DO NOTHING)
+    enrollment_id: str = Field(
+        foreign_key="enrollment.id", primary_key=True, ondelete="CASCADE")
+    lesson_id: str = Field(
+        foreign_key="lesson.id", primary_key=True, index=True, ondelete="CASCADE")
@@ -11,7 +11,7 @@ class Review(SQLModel, TimestampMixin, table=True):
     comment: str
 
     student_id: str = Field(foreign_key="user.id")
-    course_id: str = Field(foreign_key="course.id")
+    course_id: str = Field(foreign_key="course.id", index=True)
 
     student: Optional["User"] = Relationship(back_populates="reviews")
     course: Optional["Course"] = Relationship(back_populates="reviews")
@@ -0,0 +1,70 @@
+# backend/app/models/types.py
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+from typing import Optional, Tuple, Union
+import zlib
+
+# Stored layout of a compressed value:
+#   b"\x00" + codec byte + 8-byte big-endian uncompressed length + payload
+# NUL never appears in stored text (Postgres text cannot hold it), so a
+# leading NUL unambiguously marks the compressed format. Anything else is a
+# plain UTF-8 value: rows written before compression, or values too small
+# to be worth compressing.
+MARKER = b"\x00"
+CODEC_ZLIB = b"z"
+HEADER_SIZE = 10
+
+COMPRESS_MIN_SIZE = 512
+COMPRESS_LEVEL = 6
+
+
+def compress_text(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    if len(raw) < COMPRESS_MIN_SIZE:
+        return raw
+    payload = zlib.compress(raw, COMPRESS_LEVEL)
+    if len(payload) + HEADER_SIZE >= len(raw):
+        return raw
+    return MARKER + CODEC_ZLIB + len(raw).to_bytes(8, "big") + payload
+
+
+def read_header(stored: bytes) -> Optional[Tuple[bytes, int]]:
+    """Return (codec, uncompressed length) for a compressed value, else None"""
+    if stored[:1] != MARKER or len(stored) < HEADER_SIZE:
+        return None
+    return stored[1:2], int.from_bytes(stored[2:HEADER_SIZE], "big")
+
+
+def decompress_text(stored: Union[bytes, str]) -> str:
+    # SQLite hands back rows written before compression as str
+    if isinstance(stored, str):
+        return stored
+    stored = bytes(stored)
+    header = read_header(stored)
+    if header is None:
+        return stored.decode("utf-8")
+    codec, _ = header
+    if codec != CODEC_ZLIB:
+        raise ValueError(f"Unknown content codec {codec!r}")
+    return zlib.decompress(stored[HEADER_SIZE:]).decode("utf-8")
+
+
+class CompressedText(TypeDecorator):
+    """Text column stored as (optionally) zlib-compressed UTF-8 bytes.
+
+    Compression and decompression happen on bind/result, so the model keeps
+    exposing plain `str`. Queries that don't select the column never pay
+    for decompression.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return compress_text(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return decompress_text(value)
@@ -1,5 +1,5 @@
 # backend/app/routers/categories.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlmodel import Session, select
 from app.core.database import get_session
 from app.models import (
@@ -7,6 +7,11 @@ from app.models import (
 )
 from app.schemas import CategoryCreate, CategoryRead, CategoryUpdate
 from app.auth.dependencies import get_current_user, require_admin
+from app.core.cache import catalog_cache, cache_key, invalidate
+from app.core.conditional import (
+    make_etag, is_not_modified, not_modified, validator_headers
+)
+from app.core.responses import dump_json, json_bytes_response
 from typing import List
 import logging
 
@@ -17,39 +22,76 @@ router = APIRouter(prefix="/api/categories", tags=["Categories"])
 
 @router.get("/", response_model=List[CategoryRead])
 async def get_categories(
+    request: Request,
     session: Session = Depends(get_session)
 ):
-    """Get all categories (public endpoint)"""
+    """Get all categories (public endpoint, supports conditional GET)"""
+
+    key = cache_key("categories:list")
+    generation = catalog_cache.generation()
+    cached = catalog_cache.get(key)
+    if cached is None:
+        categories = session.exec(select(Category)).all()
+
+        category_reads = [
+            CategoryRead(
+                id=category.id,
+                name=category.name
+            )
+            for category in categories
+        ]
+        body = dump_json(category_reads, List[CategoryRead])
+        # Hash of the payload so deletions change the ETag too. No
+        # Last-Modified: max(updated_at) stays put when a category is deleted
+        cached = (body, make_etag(body.decode()))
+        catalog_cache.set(key, cached, tags=["categories"],
+                          generation=generation)
 
-    categories = session.exec(select(Category)).all()
+    body, etag = cached
+    if is_not_modified(request, etag):
+        return not_modified(etag)
 
-    return [
-        CategoryRead(
-            id=category.id,
-            name=category.name
-        )
-        for category in categories
-    ]
+    return json_bytes_response(body, headers=validator_headers(etag))
 
 
 @router.get("/{category_id}", response_model=CategoryRead)
 async def get_category(
     category_id: str,
+    request: Request,
     session: Session = Depends(get_session)
 ):
-    """Get category by ID"""
+    """Get category by ID (supports conditional GET)"""
+
+    key = cache_key("categories:detail", category_id=category_id)
+    generation = catalog_cache.generation()
+    cached = catalog_cache.get(key)
+    if cached is None:
+        category = session.get(Category, category_id)
+        if not category:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found"
+            )
 
-    category = session.get(Category, category_id)
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Category not found"
+        category_read = CategoryRead(
+            id=category.id,
+            name=category.name
+        )
+        cached = (
+            dump_json(category_read, CategoryRead),
+            make_etag(category.id, category.name,
+                      category.updated_at.isoformat()),
+            category.updated_at
         )
+        catalog_cache.set(key, cached, tags=[f"category:{category_id}"],
+                          generation=generation)
 
-    return CategoryRead(
-        id=category.id,
-        name=category.name
-    )
+    body, etag, last_modified = cached
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+
+    return json_bytes_response(
+        body, headers=validator_headers(etag, last_modified))
 
 
 @router.post("/", response_model=CategoryRead, status_code=status.HTTP_201_CREATED)
@@ -77,6 +119,7 @@ async def create_category(
     )
 
     session.add(new_category)
+    invalidate(session, "categories")
     session.commit()
     session.refresh(new_category)
 
@@ -122,6 +165,7 @@ async def update_category(
     for field, value in category_dict.items():
         setattr(category, field, value)
 
+    invalidate(session, "categories", f"category:{category.id}")
     session.commit()
     session.refresh(category)
 
@@ -161,6 +205,7 @@ async def delete_category(
         )
 
     session.delete(category)
+    invalidate(session, "categories", f"category:{category.id}")
     session.commit()
 
     logger.info(f"Category deleted: {category.name} by {current_user.email}")
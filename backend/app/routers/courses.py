@@ -1,23 +1,48 @@
 # backend/app/routers/courses.py
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select, func, and_
+from sqlalchemy.orm import defer
 from app.core.database import get_session
 from app.models import (
     Course, Lesson, Enrollment, Category, User, UserRole
 )
 from app.schemas import (
-    CourseCreate, CourseRead, CourseUpdate, LessonCreate, LessonRead, LessonUpdate, EnrollmentCreate, EnrollmentRead, CategoryCreate, CategoryRead
+    CourseCreate, CourseRead, CourseUpdate, CourseFacets, CoursePage, LessonCreate, LessonRead, LessonUpdate, LessonOutline, LessonBatch, LessonBatchResult, LessonMove, EnrollmentCreate, EnrollmentRead, CategoryCreate, CategoryRead
     )
 from app.auth.dependencies import (
     get_current_user, require_instructor, require_admin
 )
-from typing import List, Optional
+from app.core.cache import catalog_cache, cache_key, invalidate
+from app.core.conditional import (
+    make_etag, is_not_modified, not_modified, validator_headers, parse_range
+)
+from app.core.pagination import keyset_paginate, split_page, next_cursor_headers
+from app.core.responses import dump_json, json_response, json_bytes_response
+from app.services import catalog
+from app.services.catalog import (
+    course_rows_query, filter_courses, get_course_reads, get_course_read,
+    get_course_reads_by_ids, course_etag
+)
+from app.services import search as course_search
+from app.services import lesson_content
+from app.services import lessons as lessons_service
+from app.services.counters import bump_course_counters
+from app.services.completions import recompute_progress
+from app.services.access import (
+    require_course_access, user_access_tag, course_access_tag
+)
+from app.services.analytics import instructor_tag
+from typing import List, Optional, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/courses", tags=["Courses"])
 
+MAX_BATCH_IDS = 200
+MAX_BATCH_LESSONS = 500
+
 # Course CRUD Operations
 
 
@@ -25,121 +50,203 @@ router = APIRouter(prefix="/api/courses", tags=["Courses"])
 async def get_courses(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
     category_id: Optional[str] = Query(None),
     instructor_id: Optional[str] = Query(None),
     published_only: bool = Query(True),
+    include_description: bool = Query(True),
     session: Session = Depends(get_session)
 ):
-    """Get all courses with filtering and pagination"""
+    """Get all courses with filtering and pagination
+
+    Newest courses come first. Pass the `X-Next-Cursor` response header back
+    as `cursor` to fetch the next page; `skip` still works for older clients.
+    Search results are ordered by relevance and paginate with `skip` only.
+    With `include_description=false` the description column is not read and
+    comes back as null (card/grid views).
+    """
+
+    key = cache_key(
+        "courses:list", skip=skip, limit=limit, cursor=cursor,
+        search=" ".join(search.lower().split()) if search else None,
+        category_id=category_id, instructor_id=instructor_id,
+        published_only=published_only, include_description=include_description
+    )
+    # Taken before any read, so a write committing meanwhile keeps the
+    # result out of the cache (see TTLCache.set)
+    generation = catalog_cache.generation()
+    cached = catalog_cache.get(key)
+    if cached is not None:
+        body, next_cursor = cached
+        return json_bytes_response(body, headers=next_cursor_headers(next_cursor))
 
     # Build query
-    query = select(Course)
+    query = filter_courses(
+        session, course_rows_query(include_description),
+        search=search, category_id=category_id,
+        instructor_id=instructor_id, published_only=published_only
+    )
 
-    # Filter by published status (public endpoint shows published only by default)
-    if published_only:
-        query = query.where(Course.is_published == True)
+    # Apply pagination (keyset on created_at/id, relevance order for search)
+    query = keyset_paginate(
+        query, Course.created_at, Course.id, limit,
+        cursor=None if search else cursor, skip=skip
+    )
 
-    # Apply filters
+    # Instructor, category and counts are resolved set-wise by the catalog layer
+    course_reads, next_cursor = split_page(
+        get_course_reads(session, query), limit,
+        lambda course: (course.created_at, course.id)
+    )
     if search:
-        query = query.where(Course.title.contains(search))
-
-    if category_id:
-        query = query.where(Course.category_id == category_id)
-
-    if instructor_id:
-        query = query.where(Course.instructor_id == instructor_id)
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-
-    courses = session.exec(query).all()
-
-    # Build response with additional data
-    course_reads = []
-    for course in courses:
-        # Get instructor info
-        instructor = session.get(User, course.instructor_id)
-
-        # Get category info
-        category = session.get(
-            Category, course.category_id) if course.category_id else None
-
-        # Count lessons and enrollments
-        lessons_count = session.exec(
-            select(func.count(Lesson.id)).where(Lesson.course_id == course.id)
-        ).first()
-
-        enrollments_count = session.exec(
-            select(func.count(Enrollment.id)).where(
-                Enrollment.course_id == course.id)
-        ).first()
-
-        course_read = CourseRead(
-            id=course.id,
-            title=course.title,
-            description=course.description,
-            image=course.image,
-            price=course.price,
-            is_published=course.is_published,
-            instructor_id=course.instructor_id,
-            category_id=course.category_id,
-            created_at=course.created_at,
-            updated_at=course.updated_at,
-            lessons_count=lessons_count or 0,
-            enrollments_count=enrollments_count or 0
+        next_cursor = None
+
+    # Serialized once; cache hits return the same bytes
+    body = dump_json(course_reads, List[CourseRead])
+
+    # Any course write may change list membership ("courses"); row-level
+    # writes such as enrollments only touch pages that contain that course
+    catalog_cache.set(key, (body, next_cursor), tags=[
+        "courses",
+        *(f"course:{course.id}" for course in course_reads),
+        *(f"category:{course.category_id}" for course in course_reads
+          if course.category_id),
+    ], generation=generation)
+
+    return json_bytes_response(body, headers=next_cursor_headers(next_cursor))
+
+
+@router.get("/facets", response_model=CourseFacets)
+async def get_course_facets(
+    search: Optional[str] = Query(None),
+    category_id: Optional[str] = Query(None),
+    instructor_id: Optional[str] = Query(None),
+    session: Session = Depends(get_session)
+):
+    """Published course counts per category, price bucket and instructor
+
+    Accepts the same search/filters as the course list.
+    """
+
+    key = cache_key(
+        "courses:facets",
+        search=" ".join(search.lower().split()) if search else None,
+        category_id=category_id, instructor_id=instructor_id
+    )
+    generation = catalog_cache.generation()
+    body = catalog_cache.get(key)
+    if body is None:
+        facets = catalog.get_course_facets(
+            session, search=search, category_id=category_id,
+            instructor_id=instructor_id
         )
+        body = dump_json(facets, CourseFacets)
+        catalog_cache.set(key, body, tags=["courses", "categories"],
+                          generation=generation)
+
+    return json_bytes_response(body)
+
+
+@router.get("/batch", response_model=List[Optional[CourseRead]])
+async def get_courses_batch(
+    ids: List[str] = Query(...),
+    session: Session = Depends(get_session)
+):
+    """Get many courses by ID in one call
+
+    `ids` may be repeated or comma separated (up to MAX_BATCH_IDS). Results
+    are returned in request order, with null for unknown ids.
+    """
 
-        course_reads.append(course_read)
+    course_ids = [
+        course_id.strip()
+        for value in ids for course_id in value.split(",") if course_id.strip()
+    ]
+    if len(course_ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_IDS} course ids per request"
+        )
 
-    return course_reads
+    course_reads = get_course_reads_by_ids(session, course_ids)
+    return json_response(course_reads, List[Optional[CourseRead]])
 
 
 @router.get("/{course_id}", response_model=CourseRead)
 async def get_course(
     course_id: str,
+    request: Request,
     session: Session = Depends(get_session)
 ):
-    """Get course by ID with detailed information"""
+    """Get course by ID with detailed information
+
+    Supports conditional GET: a matching If-None-Match gets a 304 without
+    re-serializing the course. There is no Last-Modified: the counters in
+    the body change without touching updated_at, so only the ETag tracks them.
+    """
+
+    key = cache_key("courses:detail", course_id=course_id)
+    generation = catalog_cache.generation()
+    cached = catalog_cache.get(key)
+    if cached is None:
+        course_read = get_course_read(session, course_id)
+        if not course_read:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Course not found"
+            )
 
-    course = session.get(Course, course_id)
-    if not course:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Course not found"
-        )
+        cached = (dump_json(course_read, CourseRead), course_etag(course_read))
+        catalog_cache.set(key, cached, tags=[
+            f"course:{course_id}",
+            *([f"category:{course_read.category_id}"]
+              if course_read.category_id else []),
+        ], generation=generation)
 
-    # Get instructor info
-    instructor = session.get(User, course.instructor_id)
+    body, etag = cached
+    if is_not_modified(request, etag):
+        return not_modified(etag)
 
-    # Get category info
-    category = session.get(
-        Category, course.category_id) if course.category_id else None
+    return json_bytes_response(body, headers=validator_headers(etag))
 
-    # Count lessons and enrollments
-    lessons_count = session.exec(
-        select(func.count(Lesson.id)).where(Lesson.course_id == course.id)
-    ).first()
 
-    enrollments_count = session.exec(
-        select(func.count(Enrollment.id)).where(
-            Enrollment.course_id == course.id)
-    ).first()
+@router.get("/{course_id}/page", response_model=CoursePage)
+async def get_course_page(
+    course_id: str,
+    request: Request,
+    session: Session = Depends(get_session)
+):
+    """Course landing page: course, lesson outline, instructor and ratings
+
+    Public and cached; lesson bodies are not included. Supports conditional
+    GET through the ETag only (no Last-Modified, as for the course itself).
+    """
+
+    key = cache_key("courses:page", course_id=course_id)
+    generation = catalog_cache.generation()
+    cached = catalog_cache.get(key)
+    if cached is None:
+        page = catalog.get_course_page(session, course_id)
+        if not page:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Course not found"
+            )
 
-    return CourseRead(
-        id=course.id,
-        title=course.title,
-        description=course.description,
-        image=course.image,
-        price=course.price,
-        is_published=course.is_published,
-        instructor_id=course.instructor_id,
-        category_id=course.category_id,
-        created_at=course.created_at,
-        updated_at=course.updated_at,
-        lessons_count=lessons_count or 0,
-        enrollments_count=enrollments_count or 0
-    )
+        body = dump_json(page, CoursePage)
+        cached = (body, make_etag(body.decode()))
+        catalog_cache.set(key, cached, tags=[
+            f"course:{course_id}",
+            *([f"category:{page.course.category_id}"]
+              if page.course.category_id else []),
+        ], generation=generation)
+
+    body, etag = cached
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    return json_bytes_response(body, headers=validator_headers(etag))
 
 
 @router.post("/", response_model=CourseRead, status_code=status.HTTP_201_CREATED)
@@ -171,6 +278,9 @@ async def create_course(
     )
 
     session.add(new_course)
+    course_search.index_course(session, new_course)
+    invalidate(session, "courses", user_access_tag(current_user.id),
+               instructor_tag(current_user.id))
     session.commit()
     session.refresh(new_course)
 
@@ -229,25 +339,17 @@ async def update_course(
     for field, value in course_dict.items():
         setattr(course, field, value)
 
+    if "title" in course_dict or "description" in course_dict:
+        course_search.index_course(session, course)
+
+    invalidate(session, "courses", f"course:{course.id}",
+               instructor_tag(course.instructor_id))
     session.commit()
     session.refresh(course)
 
     logger.info(f"Course updated: {course.title} by {current_user.email}")
 
-    return CourseRead(
-        id=course.id,
-        title=course.title,
-        description=course.description,
-        image=course.image,
-        price=course.price,
-        is_published=course.is_published,
-        instructor_id=course.instructor_id,
-        category_id=course.category_id,
-        created_at=course.created_at,
-        updated_at=course.updated_at,
-        lessons_count=0,  # You could calculate this if needed
-        enrollments_count=0  # You could calculate this if needed
-    )
+    return get_course_read(session, course.id)
 
 
 @router.delete("/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -273,6 +375,9 @@ async def delete_course(
         )
 
     session.delete(course)
+    course_search.remove_course(session, course.id)
+    invalidate(session, "courses", f"course:{course.id}",
+               course_access_tag(course.id), instructor_tag(course.instructor_id))
     session.commit()
 
     logger.info(f"Course deleted: {course.title} by {current_user.email}")
@@ -280,46 +385,45 @@ async def delete_course(
 # Lesson Management
 
 
-@router.get("/{course_id}/lessons", response_model=List[LessonRead])
+@router.get("/{course_id}/lessons", response_model=Union[List[LessonRead], List[LessonOutline]])
 async def get_course_lessons(
     course_id: str,
+    request: Request,
+    outline: bool = Query(False),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    """Get lessons for a course (enrolled users, instructors, or admins only)"""
+    """Get lessons for a course (enrolled users, instructors, or admins only)
 
-    course = session.get(Course, course_id)
-    if not course:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Course not found"
-        )
+    With `outline=true` only id/title/order/video_url are returned and the
+    lesson bodies are never read from the database; fetch a body with
+    GET /{course_id}/lessons/{lesson_id}. Supports conditional GET; the
+    validators are checked before any lesson data is loaded.
+    """
 
-    # Check if user has access to lessons
-    has_access = False
+    require_course_access(session, course_id, current_user)
 
-    # Course owner or admin has access
-    if course.instructor_id == current_user.id or current_user.role == UserRole.ADMIN:
-        has_access = True
-    else:
-        # Check if user is enrolled
-        enrollment = session.exec(
-            select(Enrollment).where(
-                and_(
-                    Enrollment.student_id == current_user.id,
-                    Enrollment.course_id == course_id
-                )
-            )
-        ).first()
-
-        if enrollment:
-            has_access = True
-
-    if not has_access:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You must be enrolled in this course to view lessons"
-        )
+    # Cheap validator query: any insert, update or delete changes one of these
+    lessons_count, last_modified = session.exec(
+        select(func.count(Lesson.id), func.max(Lesson.updated_at))
+        .where(Lesson.course_id == course_id)
+    ).one()
+    etag = make_etag(course_id, outline, lessons_count,
+                     last_modified.isoformat() if last_modified else None)
+    # ETag only: deleting a lesson doesn't move max(updated_at), so it can't
+    # serve as Last-Modified
+    if is_not_modified(request, etag):
+        return not_modified(etag, private=True)
+
+    headers = validator_headers(etag, private=True)
+
+    if outline:
+        lesson_outlines = [
+            LessonOutline(id=lesson.id, title=lesson.title,
+                          video_url=lesson.video_url, order=lesson.order)
+            for lesson in session.execute(catalog.outline_query(course_id))
+        ]
+        return json_response(lesson_outlines, List[LessonOutline], headers=headers)
 
     # Get lessons ordered by order field
     lessons = session.exec(
@@ -328,7 +432,7 @@ async def get_course_lessons(
         .order_by(Lesson.order)
     ).all()
 
-    return [
+    lesson_reads = [
         LessonRead(
             id=lesson.id,
             title=lesson.title,
@@ -342,6 +446,102 @@ async def get_course_lessons(
         for lesson in lessons
     ]
 
+    return json_response(lesson_reads, List[LessonRead], headers=headers)
+
+
+@router.get("/{course_id}/lessons/{lesson_id}", response_model=LessonRead)
+async def get_lesson(
+    course_id: str,
+    lesson_id: str,
+    request: Request,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Get a single lesson with its content (same access rules as the list)"""
+
+    require_course_access(session, course_id, current_user)
+
+    # Body is deferred: a 304 never reads it, a 200 loads it on first access
+    lesson = session.exec(
+        select(Lesson)
+        .options(defer(Lesson.content))
+        .where(and_(Lesson.id == lesson_id, Lesson.course_id == course_id))
+    ).first()
+    if not lesson:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lesson not found"
+        )
+
+    etag = make_etag(lesson.id, lesson.updated_at.isoformat())
+    if is_not_modified(request, etag, lesson.updated_at):
+        return not_modified(etag, lesson.updated_at, private=True)
+
+    lesson_read = LessonRead(
+        id=lesson.id,
+        title=lesson.title,
+        content=lesson.content,
+        video_url=lesson.video_url,
+        order=lesson.order,
+        course_id=lesson.course_id,
+        created_at=lesson.created_at,
+        updated_at=lesson.updated_at
+    )
+
+    return json_response(
+        lesson_read, LessonRead,
+        headers=validator_headers(etag, lesson.updated_at, private=True)
+    )
+
+
+@router.get("/{course_id}/lessons/{lesson_id}/content")
+async def get_lesson_content(
+    course_id: str,
+    lesson_id: str,
+    request: Request,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream a lesson body as plain text (same access rules as the list)
+
+    The body is read from the database in chunks and never held in memory as
+    a whole. Supports conditional GET and single byte ranges, so players can
+    resume an interrupted download with `Range`/`If-Range`.
+    """
+
+    require_course_access(session, course_id, current_user)
+
+    info = lesson_content.get_content_info(session, course_id, lesson_id)
+    if not info:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lesson not found"
+        )
+    updated_at, size = info.updated_at, info.size
+
+    etag = make_etag(lesson_id, updated_at.isoformat(), "content")
+    if is_not_modified(request, etag, updated_at):
+        return not_modified(etag, updated_at, private=True)
+
+    headers = validator_headers(etag, updated_at, private=True)
+    headers["Accept-Ranges"] = "bytes"
+
+    byte_range = parse_range(request, size, etag, updated_at)
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        lesson_content.stream_content(lesson_id, info, start, end),
+        status_code=status_code,
+        media_type="text/plain; charset=utf-8",
+        headers=headers
+    )
+
 
 @router.post("/{course_id}/lessons", response_model=LessonRead, status_code=status.HTTP_201_CREATED)
 async def create_lesson(
@@ -376,6 +576,10 @@ async def create_lesson(
     )
 
     session.add(new_lesson)
+    bump_course_counters(session, course_id, lessons_count=1)
+    recompute_progress(session, course_id)
+    invalidate(session, f"course:{course_id}",
+               instructor_tag(course.instructor_id))
     session.commit()
     session.refresh(new_lesson)
 
@@ -392,3 +596,107 @@ async def create_lesson(
         created_at=new_lesson.created_at,
         updated_at=new_lesson.updated_at
     )
+
+
+def get_owned_course(session: Session, course_id: str, current_user: User) -> Course:
+    """Return the course if the user may edit its lessons, else raise 404/403"""
+
+    course = session.get(Course, course_id)
+    if not course:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course not found"
+        )
+
+    if course.instructor_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to edit lessons of this course"
+        )
+
+    return course
+
+
+@router.post("/{course_id}/lessons/batch", response_model=LessonBatchResult)
+async def batch_lessons(
+    course_id: str,
+    batch: LessonBatch,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Create, update and delete lessons in one transaction (owner or admin only)
+
+    Meant for course imports and editor saves: everything is applied with a
+    handful of statements and a single commit, or not at all. Created lessons
+    without an `order` are appended in request order.
+    """
+
+    total = len(batch.create) + len(batch.update) + len(batch.delete)
+    if total > MAX_BATCH_LESSONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_LESSONS} lesson changes per batch"
+        )
+
+    course = get_owned_course(session, course_id, current_user)
+
+    try:
+        result = lessons_service.apply_lesson_batch(session, course_id, batch)
+    except LookupError as e:
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Lessons not found in this course: {', '.join(e.args[0])}"
+        )
+
+    invalidate(session, f"course:{course_id}",
+               instructor_tag(course.instructor_id))
+    session.commit()
+
+    logger.info(
+        f"Lesson batch for course {course.title}: {len(result.created)} created, "
+        f"{result.updated} updated, {result.deleted} deleted")
+
+    return result
+
+
+@router.put("/{course_id}/lessons/{lesson_id}/move", response_model=LessonOutline)
+async def move_lesson(
+    course_id: str,
+    lesson_id: str,
+    move: LessonMove,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Move a lesson right after another one, or to the top (owner or admin only)
+
+    Only the moved lesson's order changes, apart from an occasional
+    renumbering of the course when its order keys run out of room.
+    """
+
+    get_owned_course(session, course_id, current_user)
+
+    lesson = session.exec(
+        select(Lesson)
+        .options(defer(Lesson.content))
+        .where(and_(Lesson.id == lesson_id, Lesson.course_id == course_id))
+    ).first()
+    if not lesson:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lesson not found"
+        )
+
+    try:
+        lessons_service.move_lesson(session, lesson, move.after_id)
+    except LookupError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lesson to move after not found"
+        )
+
+    invalidate(session, f"course:{course_id}")
+    session.commit()
+
+    return LessonOutline(id=lesson.id, title=lesson.title,
+                         video_url=lesson.video_url, order=lesson.order)
@@ -1,15 +1,39 @@
 # backend/app/routers/enrollments.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File
+)
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select, and_
+from sqlalchemy import case, update
 from app.core.database import get_session
 from app.models import (
-    Course, Enrollment, User, UserRole
+    Course, Enrollment, Lesson, Profile, User, UserRole
 )
 from app.schemas import (
-    EnrollmentCreate, EnrollmentRead, EnrollmentUpdate, CourseRead
+    EnrollmentCreate, EnrollmentRead, EnrollmentUpdate, CourseRead,
+    LessonCompletionBatch, CompletionResult, CohortEnrollment,
+    CohortEnrollmentResult
 )
 from app.auth.dependencies import get_current_user
-from typing import List
+from app.core.cache import invalidate
+from app.core.pagination import keyset_paginate, split_page, set_next_cursor
+from app.services.counters import bump_course_counters
+from app.services.analytics import COMPLETED_PROGRESS
+from app.services.daily_stats import bump_daily_stats, completed_at_update
+from app.core.config import settings
+from app.services.access import get_course_access, user_access_tag
+from app.services.progress import progress_buffer
+from app.services.enrollments import insert_enrollment
+from app.services.roster import ROSTER_FORMATS
+from app.services.cohorts import (
+    MAX_COHORT_SIZE, enroll_cohort, normalize_identifiers, parse_cohort_csv
+)
+from app.services.completions import (
+    complete_lessons, remove_completions_for_enrollment
+)
+from datetime import datetime
+from typing import List, Optional
+import csv
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,96 +47,136 @@ async def enroll_in_course(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    """Enroll current user in a course"""
-
-    # Get course
-    course = session.get(Course, course_id)
-    if not course:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Course not found"
-        )
-
-    # Check if course is published
-    if not course.is_published:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Course is not published"
-        )
-
-    # Check if user is already enrolled
-    existing_enrollment = session.exec(
-        select(Enrollment).where(
-            and_(
-                Enrollment.student_id == current_user.id,
-                Enrollment.course_id == course_id
+    """Enroll current user in a course
+
+    The insert itself checks that the course exists and is published and
+    skips duplicates, so the happy path is two statements and a commit.
+    """
+
+    enrollment = insert_enrollment(session, current_user.id, course_id)
+
+    if enrollment is None:
+        # Nothing inserted: work out why (error path only)
+        is_published = session.exec(
+            select(Course.is_published).where(Course.id == course_id)
+        ).first()
+        if is_published is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Course not found"
+            )
+        if not is_published:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Course is not published"
             )
-        )
-    ).first()
-
-    if existing_enrollment:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Already enrolled in this course"
         )
 
-    # Create enrollment
-    new_enrollment = Enrollment(
-        student_id=current_user.id,
-        course_id=course_id,
-        progress=0.0
-    )
-
-    session.add(new_enrollment)
+    course = bump_course_counters(
+        session, course_id, returning=(Course.title,), enrollments_count=1)
+    bump_daily_stats(session, course_id, new_enrollments=1)
+    invalidate(session, f"course:{course_id}", user_access_tag(current_user.id))
+    # Read before commit expires the user, saving a reload just for the log
+    email = current_user.email
     session.commit()
-    session.refresh(new_enrollment)
 
-    logger.info(f"User {current_user.email} enrolled in course {course.title}")
+    logger.info(f"User {email} enrolled in course {course.title}")
 
     return {
         "message": "Successfully enrolled in course",
         "enrollment": {
-            "id": new_enrollment.id,
+            "id": enrollment.id,
             "course_id": course_id,
             "course_title": course.title,
-            "progress": new_enrollment.progress,
-            "enrolled_at": new_enrollment.created_at
+            "progress": 0.0,
+            "enrolled_at": enrollment.created_at
         }
     }
 
 
 @router.get("/me", response_model=List[dict])
 async def get_my_enrollments(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    sort: str = Query("enrolled", pattern="^(enrolled|activity)$"),
+    include_description: bool = Query(False),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all courses the current user is enrolled in"""
-
-    # Get enrollments with course information
-    statement = select(Enrollment, Course).join(Course).where(
-        Enrollment.student_id == current_user.id
+    """Get all courses the current user is enrolled in
+
+    Most recent enrollments first, or with `sort=activity` the most recently
+    active (progress or completions) first. Without `limit` everything is
+    returned; with it, follow the `X-Next-Cursor` response header via
+    `cursor` with the same `sort` (400 otherwise). Course descriptions are only included on request.
+
+    Enrollment, course, instructor and profile come from a single query.
+    """
+
+    sort_column = Enrollment.updated_at if sort == "activity" else Enrollment.created_at
+    description = [Course.description] if include_description else []
+    statement = (
+        select(
+            Enrollment.id,
+            Enrollment.progress,
+            Enrollment.completed_lessons_count,
+            Enrollment.created_at,
+            Enrollment.updated_at,
+            Course.id.label("course_id"),
+            Course.title,
+            *description,
+            Course.image,
+            Course.lessons_count,
+            User.id.label("instructor_id"),
+            User.email.label("instructor_email"),
+            Profile.name.label("instructor_name"),
+            Profile.avatar.label("instructor_avatar"),
+        )
+        .join(Course, Enrollment.course_id == Course.id)
+        .join(User, Course.instructor_id == User.id)
+        .outerjoin(Profile, Profile.user_id == User.id)
+        .where(Enrollment.student_id == current_user.id)
     )
-    results = session.exec(statement).all()
+    statement = keyset_paginate(
+        statement, sort_column, Enrollment.id, limit,
+        cursor=cursor, skip=skip, sort=sort
+    )
+    results, next_cursor = split_page(
+        session.exec(statement).all(), limit,
+        lambda row: (row.updated_at if sort == "activity" else row.created_at, row.id),
+        sort=sort
+    )
+    set_next_cursor(response, next_cursor)
 
     enrollments = []
-    for enrollment, course in results:
-        # Get instructor info
-        instructor = session.get(User, course.instructor_id)
+    for row in results:
+        course = {
+            "id": row.course_id,
+            "title": row.title,
+            "image": row.image,
+            "lessons_count": row.lessons_count,
+            "instructor": {
+                "id": row.instructor_id,
+                "email": row.instructor_email,
+                "name": row.instructor_name,
+                "avatar": row.instructor_avatar
+            }
+        }
+        if include_description:
+            course["description"] = row.description
 
         enrollments.append({
-            "enrollment_id": enrollment.id,
-            "progress": enrollment.progress,
-            "enrolled_at": enrollment.created_at,
-            "course": {
-                "id": course.id,
-                "title": course.title,
-                "description": course.description,
-                "image": course.image,
-                "instructor": {
-                    "id": instructor.id if instructor else None,
-                    "email": instructor.email if instructor else None
-                }
-            }
+            "enrollment_id": row.id,
+            "progress": row.progress,
+            "completed_lessons_count": row.completed_lessons_count,
+            "enrolled_at": row.created_at,
+            "last_activity_at": row.updated_at,
+            "course": course
         })
 
     return enrollments
@@ -125,39 +189,172 @@ async def update_course_progress(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    """Update progress for a course enrollment"""
+    """Update progress for a course enrollment
+
+    Progress never goes down: a report lower than the stored value leaves it
+    as is, and the response carries the stored value. Reports only apply to
+    enrollments without completed lessons (clients that don't use
+    /lessons/.../complete); once lessons are completed, progress is the
+    completion ratio and follows the course's lesson count instead.
+
+    With PROGRESS_BUFFER_ENABLED the report is only recorded in memory and
+    written in a batch a few seconds later (see app/services/progress.py);
+    the enrollment check comes from the access cache, so the request
+    normally doesn't touch the database at all. The stored value isn't known
+    then, so the response is an acknowledgement without `progress`.
+    """
+
+    if settings.PROGRESS_BUFFER_ENABLED and progress_data.progress is not None:
+        if course_id not in get_course_access(session, current_user.id).enrolled:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Enrollment not found"
+            )
 
-    # Find enrollment
-    enrollment = session.exec(
-        select(Enrollment).where(
-            and_(
-                Enrollment.student_id == current_user.id,
-                Enrollment.course_id == course_id
+        progress_buffer.add(current_user.id, course_id, progress_data.progress)
+        return {
+            "message": "Progress update accepted",
+            "pending": True
+        }
+
+    enrollment_filter = and_(
+        Enrollment.student_id == current_user.id,
+        Enrollment.course_id == course_id
+    )
+
+    if progress_data.progress is None:
+        progress = session.exec(
+            select(Enrollment.progress).where(enrollment_filter)
+        ).first()
+        if progress is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Enrollment not found"
             )
+        return {
+            "message": "Progress updated successfully",
+            "progress": progress
+        }
+
+    # Never lowered, like the progress buffer: a late or out-of-order report
+    # can't undo progress (or a completion). Enrollments with completed
+    # lessons are left to the completion ratio (see recompute_progress)
+    now = datetime.utcnow()
+    new_progress = case(
+        (and_(Enrollment.completed_lessons_count == 0,
+              Enrollment.progress < progress_data.progress),
+         progress_data.progress),
+        else_=Enrollment.progress
+    )
+    row = session.execute(
+        update(Enrollment)
+        .where(enrollment_filter)
+        .values(
+            progress=new_progress,
+            completed_at=completed_at_update(
+                new_progress >= COMPLETED_PROGRESS, now)
         )
+        .returning(Enrollment.progress, Enrollment.completed_at)
+        .execution_options(synchronize_session=False)
     ).first()
 
-    if not enrollment:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Enrollment not found"
         )
 
-    # Update progress
-    if progress_data.progress is not None:
-        enrollment.progress = progress_data.progress
-        session.commit()
-        session.refresh(enrollment)
+    if row.completed_at == now:
+        bump_daily_stats(session, course_id, now.date(), completions=1)
+    # Read before commit expires the user, saving a reload just for the log
+    email = current_user.email
+    session.commit()
 
-        logger.info(
-            f"Progress updated for user {current_user.email} in course {course_id}: {progress_data.progress}%")
+    logger.info(
+        f"Progress updated for user {email} in course {course_id}: {row.progress}%")
 
     return {
         "message": "Progress updated successfully",
-        "progress": enrollment.progress
+        "progress": float(row.progress)
     }
 
 
+MAX_COMPLETION_BATCH = 500
+
+
+def mark_lessons_complete(
+    session: Session,
+    course_id: str,
+    lesson_ids: List[str],
+    current_user: User
+) -> CompletionResult:
+    enrollment_id = session.exec(
+        select(Enrollment.id).where(
+            and_(
+                Enrollment.student_id == current_user.id,
+                Enrollment.course_id == course_id
+            )
+        )
+    ).first()
+
+    if not enrollment_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Enrollment not found"
+        )
+
+    result = complete_lessons(session, enrollment_id, course_id, lesson_ids)
+    session.commit()
+
+    return result
+
+
+@router.post("/courses/{course_id}/lessons/{lesson_id}/complete", response_model=CompletionResult)
+async def complete_lesson(
+    course_id: str,
+    lesson_id: str,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Mark a lesson complete; course progress follows completed/total lessons
+
+    Completing a lesson twice is harmless (`completed` is 0 the second time).
+    """
+
+    result = mark_lessons_complete(session, course_id, [lesson_id], current_user)
+    if not result.completed and not session.exec(
+        select(Lesson.id).where(
+            and_(Lesson.id == lesson_id, Lesson.course_id == course_id))
+    ).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lesson not found"
+        )
+
+    return result
+
+
+@router.post("/courses/{course_id}/lessons/complete", response_model=CompletionResult)
+async def complete_lessons_batch(
+    course_id: str,
+    batch: LessonCompletionBatch,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Mark several lessons complete at once (e.g. after working offline)
+
+    Ids that are not lessons of the course are ignored.
+    """
+
+    if len(batch.lesson_ids) > MAX_COMPLETION_BATCH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_COMPLETION_BATCH} lessons per request"
+        )
+
+    return mark_lessons_complete(session, course_id, batch.lesson_ids, current_user)
+
+
 @router.delete("/courses/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def unenroll_from_course(
     course_id: str,
@@ -183,7 +380,11 @@ async def unenroll_from_course(
         )
 
     # Delete enrollment
+    remove_completions_for_enrollment(session, enrollment.id)
     session.delete(enrollment)
+    bump_course_counters(session, course_id, enrollments_count=-1)
+    bump_daily_stats(session, course_id, unenrollments=1)
+    invalidate(session, f"course:{course_id}", user_access_tag(current_user.id))
     session.commit()
 
     logger.info(
@@ -195,10 +396,17 @@ async def unenroll_from_course(
 @router.get("/courses/{course_id}/students", response_model=List[dict])
 async def get_course_students(
     course_id: str,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all students enrolled in a course (instructor/admin only)"""
+    """Get all students enrolled in a course (instructor/admin only)
+
+    Paginates like /me: newest first, `limit` plus `X-Next-Cursor`.
+    """
 
     # Get course
     course = session.get(Course, course_id)
@@ -219,7 +427,15 @@ async def get_course_students(
     statement = select(Enrollment, User).join(User, Enrollment.student_id == User.id).where(
         Enrollment.course_id == course_id
     )
-    results = session.exec(statement).all()
+    statement = keyset_paginate(
+        statement, Enrollment.created_at, Enrollment.id, limit,
+        cursor=cursor, skip=skip
+    )
+    results, next_cursor = split_page(
+        session.exec(statement).all(), limit,
+        lambda row: (row[0].created_at, row[0].id)
+    )
+    set_next_cursor(response, next_cursor)
 
     students = []
     for enrollment, student in results:
@@ -234,3 +450,131 @@ async def get_course_students(
         })
 
     return students
+
+
+def get_managed_course(session: Session, course_id: str, current_user: User) -> Course:
+    """Return the course if the user owns it or is an admin, else raise 404/403"""
+
+    course = session.get(Course, course_id)
+    if not course:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course not found"
+        )
+
+    if course.instructor_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to manage course enrollments"
+        )
+
+    return course
+
+
+def run_cohort_enrollment(
+    session: Session,
+    course_id: str,
+    student_ids: List[str],
+    emails: List[str],
+    current_user: User
+) -> CohortEnrollmentResult:
+    course = get_managed_course(session, course_id, current_user)
+
+    student_ids, emails = normalize_identifiers(student_ids, emails)
+    if len(student_ids) + len(emails) > MAX_COHORT_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_COHORT_SIZE} students per cohort"
+        )
+
+    # Read before commit expires them, saving reloads just for the log
+    course_title, email = course.title, current_user.email
+    result = enroll_cohort(session, course_id, student_ids, emails)
+    session.commit()
+
+    logger.info(
+        f"Cohort enrollment into {course_title} by {email}: "
+        f"{result.created} created, {result.skipped} skipped, {result.unknown} unknown")
+
+    return result
+
+
+@router.post("/courses/{course_id}/cohort", response_model=CohortEnrollmentResult)
+async def enroll_cohort_in_course(
+    course_id: str,
+    cohort: CohortEnrollment,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Enroll a list of students by id and/or email (course owner or admin only)
+
+    Students already enrolled are skipped; ids/emails that match no user are
+    counted as unknown and listed (up to 100) in the response.
+    """
+
+    return run_cohort_enrollment(
+        session, course_id, cohort.student_ids, cohort.emails, current_user)
+
+
+@router.post("/courses/{course_id}/cohort/upload", response_model=CohortEnrollmentResult)
+async def enroll_cohort_from_csv(
+    course_id: str,
+    file: UploadFile = File(...),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Enroll the students listed in an uploaded CSV of emails and/or ids
+
+    Same rules as /cohort; cells containing "@" are read as emails.
+    """
+
+    try:
+        student_ids, emails = parse_cohort_csv(await file.read())
+    except (UnicodeDecodeError, csv.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be a UTF-8 encoded CSV"
+        )
+
+    return run_cohort_enrollment(
+        session, course_id, student_ids, emails, current_user)
+
+
+@router.get("/courses/{course_id}/students/export")
+async def export_course_students(
+    course_id: str,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Download the full course roster as CSV or NDJSON (instructor/admin only)
+
+    Rows are streamed as they are read from the database, in batches, so
+    exports of very large courses use constant memory on the server.
+    """
+
+    course = session.get(Course, course_id)
+    if not course:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course not found"
+        )
+
+    # Check permission (course owner or admin)
+    if course.instructor_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view course enrollments"
+        )
+
+    media_type, stream = ROSTER_FORMATS[format]
+    logger.info(f"Roster export ({format}) of course {course_id} by {current_user.email}")
+
+    return StreamingResponse(
+        stream(course_id),
+        media_type=media_type,
+        headers={
+            "Content-Disposition":
+                f'attachment; filename="course-{course_id}-students.{format}"'
+        }
+    )
@@ -1,13 +1,18 @@
 # backend/app/routers/instructor.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select, func, and_
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlmodel import Session, select
 from app.core.database import get_session
-from app.models import (
-    Course, Lesson, Enrollment, Review, User,
-    UserRole
-)
+from app.models import Course, User, UserRole
 from app.auth.dependencies import get_current_user, require_instructor
-from typing import List, Dict, Any
+from app.services.catalog import average_rating
+from app.core.cache import cache_key
+from app.services.analytics import (
+    analytics_cache, instructor_tag, load_course_analytics,
+    load_course_timeseries, load_instructor_dashboard
+)
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import List, Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,79 +25,24 @@ async def get_instructor_dashboard(
     session: Session = Depends(get_session),
     current_user: User = Depends(require_instructor)
 ):
-    """Get instructor dashboard statistics"""
-
-    # Get total courses
-    total_courses = session.exec(
-        select(func.count(Course.id)).where(
-            Course.instructor_id == current_user.id)
-    ).first()
-
-    # Get published courses
-    published_courses = session.exec(
-        select(func.count(Course.id)).where(
-            and_(
-                Course.instructor_id == current_user.id,
-                Course.is_published == True
-            )
-        )
-    ).first()
-
-    # Get total enrollments across all courses
-    total_enrollments = session.exec(
-        select(func.count(Enrollment.id))
-        .select_from(Enrollment)
-        .join(Course)
-        .where(Course.instructor_id == current_user.id)
-    ).first()
-
-    # Get total lessons
-    total_lessons = session.exec(
-        select(func.count(Lesson.id))
-        .select_from(Lesson)
-        .join(Course)
-        .where(Course.instructor_id == current_user.id)
-    ).first()
-
-    # Get average rating across all courses
-    avg_rating = session.exec(
-        select(func.avg(Review.rating))
-        .select_from(Review)
-        .join(Course)
-        .where(Course.instructor_id == current_user.id)
-    ).first()
-
-    # Get recent enrollments (last 5)
-    recent_enrollments = session.exec(
-        select(Enrollment, Course, User)
-        .select_from(Enrollment)
-        .join(Course)
-        .join(User, Enrollment.student_id == User.id)
-        .where(Course.instructor_id == current_user.id)
-        .order_by(Enrollment.created_at.desc())
-        .limit(5)
-    ).all()
+    """Get instructor dashboard statistics
 
-    recent_enrollments_data = [
-        {
-            "student_email": user.email,
-            "course_title": course.title,
-            "enrolled_at": enrollment.created_at,
-            "progress": enrollment.progress
-        }
-        for enrollment, course, user in recent_enrollments
-    ]
+    One query: totals come from the per-course counters, recent enrollments
+    from the enrollment index (see instructor_dashboard_query). Cached with
+    stale-while-revalidate: up to ANALYTICS_CACHE_TTL seconds behind, and
+    refreshed at once when the instructor changes a course.
+    """
 
-    return {
-        "overview": {
-            "total_courses": total_courses or 0,
-            "published_courses": published_courses or 0,
-            "total_students": total_enrollments or 0,
-            "total_lessons": total_lessons or 0,
-            "average_rating": round(float(avg_rating), 2) if avg_rating else 0.0
-        },
-        "recent_enrollments": recent_enrollments_data
-    }
+    instructor_id = current_user.id
+    # A miss computes on the threadpool with a session of its own: hand the
+    # request's connection back to the pool rather than hold two
+    session.close()
+
+    return await analytics_cache.get_or_compute_async(
+        cache_key("instructor:dashboard", instructor_id=instructor_id),
+        partial(load_instructor_dashboard, instructor_id),
+        tags=(instructor_tag(instructor_id),)
+    )
 
 
 @router.get("/courses", response_model=List[Dict[str, Any]])
@@ -108,24 +58,8 @@ async def get_instructor_courses(
 
     courses_data = []
     for course in courses:
-        # Get course statistics
-        lessons_count = session.exec(
-            select(func.count(Lesson.id)).where(Lesson.course_id == course.id)
-        ).first()
-
-        enrollments_count = session.exec(
-            select(func.count(Enrollment.id)).where(
-                Enrollment.course_id == course.id)
-        ).first()
-
-        # Get average rating for this course
-        avg_rating = session.exec(
-            select(func.avg(Review.rating)).where(
-                Review.course_id == course.id)
-        ).first()
-
         # Get total revenue (if course has price)
-        total_revenue = (course.price or 0) * (enrollments_count or 0)
+        total_revenue = (course.price or 0) * course.enrollments_count
 
         courses_data.append({
             "id": course.id,
@@ -137,9 +71,9 @@ async def get_instructor_courses(
             "created_at": course.created_at,
             "updated_at": course.updated_at,
             "statistics": {
-                "lessons_count": lessons_count or 0,
-                "enrollments_count": enrollments_count or 0,
-                "average_rating": round(float(avg_rating), 2) if avg_rating else 0.0,
+                "lessons_count": course.lessons_count,
+                "enrollments_count": course.enrollments_count,
+                "average_rating": average_rating(course),
                 "total_revenue": total_revenue
             }
         })
@@ -153,7 +87,12 @@ async def get_course_analytics(
     session: Session = Depends(get_session),
     current_user: User = Depends(require_instructor)
 ):
-    """Get detailed analytics for a specific course"""
+    """Get detailed analytics for a specific course
+
+    Computed entirely in the database (see app/services/analytics.py), so
+    cost doesn't grow with the number of enrollments and reviews loaded.
+    Cached like the dashboard; the ownership check runs on every request.
+    """
 
     # Verify course ownership
     course = session.get(Course, course_id)
@@ -169,69 +108,79 @@ async def get_course_analytics(
             detail="Not authorized to view analytics for this course"
         )
 
-    # Get enrollments with progress data
-    enrollments = session.exec(
-        select(Enrollment).where(Enrollment.course_id == course_id)
-    ).all()
+    tags = (f"course:{course_id}", instructor_tag(course.instructor_id))
+    session.close()
 
-    # Calculate progress statistics
-    total_enrollments = len(enrollments)
-    if total_enrollments > 0:
-        total_progress = sum(e.progress for e in enrollments)
-        avg_progress = total_progress / total_enrollments
-
-        # Count completion rates
-        completed_count = sum(1 for e in enrollments if e.progress >= 100.0)
-        completion_rate = (completed_count / total_enrollments) * 100
-    else:
-        avg_progress = 0.0
-        completion_rate = 0.0
-        completed_count = 0
-
-    # Get reviews
-    reviews = session.exec(
-        select(Review).where(Review.course_id == course_id)
-    ).all()
+    try:
+        return await analytics_cache.get_or_compute_async(
+            cache_key("instructor:analytics", course_id=course_id),
+            partial(load_course_analytics, course_id),
+            tags=tags
+        )
+    except LookupError:
+        # Deleted between the ownership check and the computation
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course not found"
+        )
 
-    review_stats = {
-        "total_reviews": len(reviews),
-        "average_rating": round(sum(r.rating for r in reviews) / len(reviews), 2) if reviews else 0.0,
-        "rating_distribution": {
-            "5_star": sum(1 for r in reviews if r.rating == 5),
-            "4_star": sum(1 for r in reviews if r.rating == 4),
-            "3_star": sum(1 for r in reviews if r.rating == 3),
-            "2_star": sum(1 for r in reviews if r.rating == 2),
-            "1_star": sum(1 for r in reviews if r.rating == 1),
-        }
-    }
 
-    # Get lesson count
-    lessons_count = session.exec(
-        select(func.count(Lesson.id)).where(Lesson.course_id == course_id)
-    ).first()
+MAX_TIMESERIES_DAYS = 366
+
+
+@router.get("/courses/{course_id}/analytics/timeseries", response_model=Dict[str, Any])
+async def get_course_timeseries(
+    course_id: str,
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(require_instructor)
+):
+    """Daily enrollments, unenrollments, completions and ratings for a course
+
+    Defaults to the last 30 days (UTC). Read from the per-day rollup table
+    only, so the cost depends on the number of days, not on course size.
+    """
 
-    # Calculate revenue
-    total_revenue = (course.price or 0) * total_enrollments
+    course = session.get(Course, course_id)
+    if not course:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course not found"
+        )
+
+    if course.instructor_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view analytics for this course"
+        )
 
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end"
+        )
+    if (end - start).days >= MAX_TIMESERIES_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_TIMESERIES_DAYS} days per request"
+        )
+
+    session.close()
+
+    points = await analytics_cache.get_or_compute_async(
+        cache_key("instructor:timeseries", course_id=course_id,
+                  start=start, end=end),
+        partial(load_course_timeseries, course_id, start, end),
+        tags=(f"course:{course_id}",)
+    )
     return {
-        "course_info": {
-            "id": course.id,
-            "title": course.title,
-            "price": course.price,
-            "is_published": course.is_published,
-            "lessons_count": lessons_count or 0
-        },
-        "enrollment_stats": {
-            "total_enrollments": total_enrollments,
-            "completed_enrollments": completed_count,
-            "average_progress": round(avg_progress, 2),
-            "completion_rate": round(completion_rate, 2)
-        },
-        "review_stats": review_stats,
-        "revenue_stats": {
-            "total_revenue": total_revenue,
-            "revenue_per_enrollment": course.price or 0
-        }
+        "course_id": course_id,
+        "start": start,
+        "end": end,
+        "points": points
     }
 
 
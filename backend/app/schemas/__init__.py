@@ -1,9 +1,15 @@
 from .user import UserCreate, UserRead, UserUpdate
-from .profile import ProfileCreate, ProfileRead, ProfileUpdate
-from .course import CourseCreate, CourseRead, CourseUpdate
-from .lesson import LessonCreate, LessonRead, LessonUpdate
-from .enrollment import EnrollmentCreate, EnrollmentRead, EnrollmentUpdate
-from .review import ReviewCreate, ReviewRead, ReviewUpdate
+from .profile import ProfileCreate, ProfileRead, ProfileUpdate, InstructorProfile
+from .course import CourseCreate, CourseRead, CourseUpdate, FacetBucket, CourseFacets, CoursePage
+from .lesson import (
+    LessonCreate, LessonRead, LessonUpdate, LessonOutline, LessonBatchCreate,
+    LessonBatchUpdate, LessonBatch, LessonBatchResult, LessonMove
+)
+from .enrollment import (
+    EnrollmentCreate, EnrollmentRead, EnrollmentUpdate, LessonCompletionBatch,
+    CompletionResult, CohortEnrollment, CohortEnrollmentResult
+)
+from .review import ReviewCreate, ReviewRead, ReviewUpdate, RatingSummary
 from .category import CategoryCreate, CategoryRead, CategoryUpdate
 from .refreshtoken import RefreshTokenCreate, RefreshTokenRead
 
@@ -11,15 +17,20 @@ __all__ = [
     # user
     "UserCreate", "UserRead", "UserUpdate",
     # profile
-    "ProfileCreate", "ProfileRead", "ProfileUpdate",
+    "ProfileCreate", "ProfileRead", "ProfileUpdate", "InstructorProfile",
     # course
-    "CourseCreate", "CourseRead", "CourseUpdate",
+    "CourseCreate", "CourseRead", "CourseUpdate", "FacetBucket", "CourseFacets",
+    "CoursePage",
     # lesson
-    "LessonCreate", "LessonRead", "LessonUpdate",
+    "LessonCreate", "LessonRead", "LessonUpdate", "LessonOutline",
+    "LessonBatchCreate", "LessonBatchUpdate", "LessonBatch", "LessonBatchResult",
+    "LessonMove",
     # enrollment
     "EnrollmentCreate", "EnrollmentRead", "EnrollmentUpdate",
+    "LessonCompletionBatch", "CompletionResult", "CohortEnrollment",
+    "CohortEnrollmentResult",
     # review
-    "ReviewCreate", "ReviewRead", "ReviewUpdate",
+    "ReviewCreate", "ReviewRead", "ReviewUpdate", "RatingSummary",
     # category
     "CategoryCreate", "CategoryRead", "CategoryUpdate",
     # refresh token
@@ -1,8 +1,11 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from .user import UserRead
 from .category import CategoryRead
+from .lesson import LessonOutline
+from .profile import InstructorProfile
+from .review import RatingSummary
 
 
 class CourseCreate(BaseModel):
@@ -17,7 +20,7 @@ class CourseCreate(BaseModel):
 class CourseRead(BaseModel):
     id: str
     title: str
-    description: str
+    description: Optional[str] = None
     image: Optional[str] = None
     price: Optional[float]
     is_published: bool
@@ -30,6 +33,8 @@ class CourseRead(BaseModel):
     category: Optional[CategoryRead] = None
     lessons_count: Optional[int] = None
     enrollments_count: Optional[int] = None
+    reviews_count: Optional[int] = None
+    average_rating: Optional[float] = None
 
 
 class CourseUpdate(BaseModel):
@@ -39,3 +44,24 @@ class CourseUpdate(BaseModel):
     price: Optional[float] = None
     is_published: Optional[bool] = None
     category_id: Optional[str] = None
+
+
+class FacetBucket(BaseModel):
+    value: Optional[str] = None
+    label: str
+    count: int
+
+
+class CourseFacets(BaseModel):
+    total: int
+    categories: List[FacetBucket]
+    price: List[FacetBucket]
+    instructors: List[FacetBucket]
+
+
+class CoursePage(BaseModel):
+    """Everything a course landing page needs, in one response"""
+    course: CourseRead
+    outline: List[LessonOutline]
+    instructor: InstructorProfile
+    rating: RatingSummary
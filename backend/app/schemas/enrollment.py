@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from .course import CourseRead
 
 
@@ -21,3 +21,29 @@ class EnrollmentRead(BaseModel):
 
 class EnrollmentUpdate(BaseModel):
     progress: Optional[float] = None
+
+
+class LessonCompletionBatch(BaseModel):
+    lesson_ids: List[str]
+
+
+class CompletionResult(BaseModel):
+    """Outcome of marking lessons complete"""
+    # Lessons newly marked complete by this request
+    completed: int
+    completed_lessons_count: int
+    progress: float
+
+
+class CohortEnrollment(BaseModel):
+    student_ids: List[str] = []
+    emails: List[str] = []
+
+
+class CohortEnrollmentResult(BaseModel):
+    created: int
+    # Resolved students that were already enrolled
+    skipped: int
+    # Ids/emails that matched no user (the list is capped)
+    unknown: int
+    unknown_identifiers: List[str] = []
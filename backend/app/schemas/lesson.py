@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 class LessonCreate(BaseModel):
@@ -21,8 +21,55 @@ class LessonRead(BaseModel):
     updated_at: datetime
 
 
+class LessonOutline(BaseModel):
+    """Lesson without its body, for sidebars and course landing pages"""
+    id: str
+    title: str
+    video_url: Optional[str] = None
+    order: int
+
+
 class LessonUpdate(BaseModel):
     title: Optional[str] = None
     content: Optional[str] = None
     video_url: Optional[str] = None
     order: Optional[int] = None
+
+
+class LessonBatchCreate(BaseModel):
+    """New lesson in a batch; without `order` it is appended to the course"""
+    title: str
+    content: str
+    video_url: Optional[str] = None
+    order: Optional[int] = Field(None, ge=1)
+
+
+class LessonBatchUpdate(LessonUpdate):
+    """Partial update: omitted fields are left alone, video_url may be null"""
+    id: str
+    order: Optional[int] = Field(None, ge=1)
+
+    @field_validator("title", "content", "order")
+    @classmethod
+    def not_null(cls, value):
+        # Optional only so the field can be omitted; null is not a value
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+
+class LessonBatch(BaseModel):
+    create: List[LessonBatchCreate] = []
+    update: List[LessonBatchUpdate] = []
+    delete: List[str] = []
+
+
+class LessonBatchResult(BaseModel):
+    created: List[LessonOutline]
+    updated: int
+    deleted: int
+
+
+class LessonMove(BaseModel):
+    """Place a lesson right after `after_id`, or first when it is omitted"""
+    after_id: Optional[str] = None
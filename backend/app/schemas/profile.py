@@ -23,3 +23,10 @@ class ProfileUpdate(BaseModel):
     name: Optional[str] = None
     bio: Optional[str] = None
     avatar: Optional[str] = None
+
+
+class InstructorProfile(BaseModel):
+    user_id: str
+    name: Optional[str] = None
+    bio: Optional[str] = None
+    avatar: Optional[str] = None
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 from .user import UserRead
 
 
@@ -24,3 +24,9 @@ class ReviewRead(BaseModel):
 class ReviewUpdate(BaseModel):
     rating: Optional[int] = None
     comment: Optional[str] = None
+
+
+class RatingSummary(BaseModel):
+    average_rating: float
+    total_reviews: int
+    rating_distribution: Dict[str, int]
@@ -0,0 +1,87 @@
+# backend/app/services/access.py
+from fastapi import HTTPException, status
+from sqlmodel import Session, select
+from sqlalchemy import literal, union_all
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models import Course, Enrollment, User, UserRole
+from typing import FrozenSet, NamedTuple
+
+# Per-user sets of course ids the user may read lessons of. Entries are
+# tagged so writers can drop them via `invalidate()`:
+#   user:<id>:access     enroll / unenroll / course created by the user
+#   course:<id>:access   course deleted (drops it for every cached user)
+access_cache = TTLCache(
+    "course_access", settings.ACCESS_CACHE_SIZE, settings.ACCESS_CACHE_TTL)
+
+
+class CourseAccess(NamedTuple):
+    enrolled: FrozenSet[str]
+    owned: FrozenSet[str]
+
+    def allows(self, course_id: str) -> bool:
+        return course_id in self.enrolled or course_id in self.owned
+
+
+def user_access_tag(user_id: str) -> str:
+    return f"user:{user_id}:access"
+
+
+def course_access_tag(course_id: str) -> str:
+    return f"course:{course_id}:access"
+
+
+def get_course_access(session: Session, user_id: str) -> CourseAccess:
+    """Enrolled and owned course ids for a user, from cache or one query"""
+    key = f"access:{user_id}"
+    # Taken before the read: an enroll/unenroll committing while we query
+    # keeps this result out of the cache (see TTLCache.set)
+    generation = access_cache.generation()
+    cached = access_cache.get(key)
+    if cached is not None:
+        return cached
+
+    statement = union_all(
+        select(Enrollment.course_id, literal(True).label("enrolled"))
+        .where(Enrollment.student_id == user_id),
+        select(Course.id, literal(False).label("enrolled"))
+        .where(Course.instructor_id == user_id)
+    )
+    enrolled, owned = set(), set()
+    for course_id, is_enrollment in session.execute(statement):
+        (enrolled if is_enrollment else owned).add(course_id)
+
+    access = CourseAccess(frozenset(enrolled), frozenset(owned))
+    access_cache.set(
+        key, access,
+        tags=[user_access_tag(user_id),
+              *(course_access_tag(course_id) for course_id in enrolled | owned)],
+        generation=generation
+    )
+    return access
+
+
+def require_course_access(session: Session, course_id: str, current_user: User):
+    """Raise 404/403 unless the user may read the course's lessons.
+
+    Course owners, enrolled students and admins have access. For them the
+    check is normally served from the cache without touching the database;
+    only admins and refused users pay for a course lookup (to tell 404 from
+    403).
+    """
+    if current_user.role != UserRole.ADMIN:
+        if get_course_access(session, current_user.id).allows(course_id):
+            return
+
+    exists = session.exec(select(Course.id).where(Course.id == course_id)).first()
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course not found"
+        )
+
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You must be enrolled in this course to view lessons"
+        )
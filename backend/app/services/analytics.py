@@ -0,0 +1,203 @@
+# backend/app/services/analytics.py
+from sqlmodel import Session, select, func
+from sqlalchemy import true
+from app.core.cache import StaleWhileRevalidateCache
+from app.core.config import settings
+from app.core.database import get_db_session
+from app.models import Course, Enrollment, Review, User
+from app.services.daily_stats import course_timeseries
+from datetime import date
+from typing import Any, Dict, List
+
+COMPLETED_PROGRESS = 100.0
+RECENT_ENROLLMENTS = 5
+
+# Instructor dashboards and course analytics. Entries are tagged so writers
+# can bust them via `invalidate()`:
+#   instructor:<id>   the instructor's courses or lessons changed
+#   course:<id>       anything about the course changed (incl. enrollments)
+analytics_cache = StaleWhileRevalidateCache(
+    "analytics", settings.ANALYTICS_CACHE_SIZE, settings.ANALYTICS_CACHE_TTL,
+    settings.ANALYTICS_CACHE_MAX_STALE)
+
+
+def instructor_tag(instructor_id: str) -> str:
+    return f"instructor:{instructor_id}"
+
+
+def course_stats_query(course_id: str):
+    """One row of enrollment and review aggregates for a course.
+
+    Two single-row aggregate subqueries (each an index range scan on
+    course_id) joined together, so the whole payload is one round trip and
+    no enrollment or review rows leave the database.
+    """
+    enrollments = (
+        select(
+            func.count(Enrollment.id).label("total_enrollments"),
+            func.coalesce(func.avg(Enrollment.progress), 0.0)
+            .label("average_progress"),
+            func.count(Enrollment.id)
+            .filter(Enrollment.progress >= COMPLETED_PROGRESS)
+            .label("completed_enrollments"),
+        )
+        .where(Enrollment.course_id == course_id)
+        .subquery()
+    )
+    reviews = (
+        select(
+            func.count(Review.id).label("total_reviews"),
+            func.coalesce(func.avg(Review.rating), 0.0).label("average_rating"),
+            *(
+                func.count(Review.id).filter(Review.rating == stars)
+                .label(f"star_{stars}")
+                for stars in range(5, 0, -1)
+            ),
+        )
+        .where(Review.course_id == course_id)
+        .subquery()
+    )
+    # Both sides are single-row aggregates: a cross join
+    return select(enrollments, reviews).select_from(
+        enrollments.join(reviews, true()))
+
+
+def get_course_analytics(session: Session, course: Course) -> Dict[str, Any]:
+    stats = session.execute(course_stats_query(course.id)).one()
+
+    total_enrollments = stats.total_enrollments
+    completion_rate = (
+        stats.completed_enrollments / total_enrollments * 100
+        if total_enrollments else 0.0
+    )
+
+    return {
+        "course_info": {
+            "id": course.id,
+            "title": course.title,
+            "price": course.price,
+            "is_published": course.is_published,
+            "lessons_count": course.lessons_count
+        },
+        "enrollment_stats": {
+            "total_enrollments": total_enrollments,
+            "completed_enrollments": stats.completed_enrollments,
+            "average_progress": round(float(stats.average_progress), 2),
+            "completion_rate": round(completion_rate, 2)
+        },
+        "review_stats": {
+            "total_reviews": stats.total_reviews,
+            "average_rating": round(float(stats.average_rating), 2),
+            "rating_distribution": {
+                f"{stars}_star": getattr(stats, f"star_{stars}")
+                for stars in range(5, 0, -1)
+            }
+        },
+        "revenue_stats": {
+            "total_revenue": (course.price or 0) * total_enrollments,
+            "revenue_per_enrollment": course.price or 0
+        }
+    }
+
+
+def instructor_dashboard_query(instructor_id: str):
+    """Dashboard overview and recent enrollments as one statement.
+
+    WITH stats AS (one row summed from the course counters), recent AS (the
+    latest enrollments) SELECT ... FROM stats LEFT JOIN recent: one row per
+    recent enrollment with the overview repeated on each, or a single row
+    with NULL enrollment columns when there are none.
+
+    recent still needs a top-N sort: ix_enrollment_course_id_created_at_id
+    finds each course's enrollments, but no index is ordered by created_at
+    across all of an instructor's courses, so every one of their enrollments
+    is read and the newest kept (a bounded heap, not a full sort). Student
+    emails are joined after the LIMIT, for the few rows returned only.
+    """
+    stats = (
+        select(
+            func.count(Course.id).label("total_courses"),
+            func.count(Course.id).filter(Course.is_published == True)
+            .label("published_courses"),
+            func.coalesce(func.sum(Course.enrollments_count), 0)
+            .label("total_students"),
+            func.coalesce(func.sum(Course.lessons_count), 0)
+            .label("total_lessons"),
+            func.coalesce(func.sum(Course.rating_sum), 0).label("rating_sum"),
+            func.coalesce(func.sum(Course.rating_count), 0).label("rating_count"),
+        )
+        .where(Course.instructor_id == instructor_id)
+        .cte("stats")
+    )
+    recent = (
+        select(
+            Enrollment.id.label("enrollment_id"),
+            Enrollment.student_id,
+            Course.title.label("course_title"),
+            Enrollment.created_at.label("enrolled_at"),
+            Enrollment.progress,
+        )
+        .join(Course, Enrollment.course_id == Course.id)
+        .where(Course.instructor_id == instructor_id)
+        .order_by(Enrollment.created_at.desc(), Enrollment.id.desc())
+        .limit(RECENT_ENROLLMENTS)
+        .cte("recent")
+    )
+    return (
+        select(stats, recent, User.email.label("student_email"))
+        .select_from(
+            stats.outerjoin(recent, true())
+            .outerjoin(User, User.id == recent.c.student_id))
+        .order_by(recent.c.enrolled_at.desc(), recent.c.enrollment_id.desc())
+    )
+
+
+def get_instructor_dashboard(session: Session, instructor_id: str) -> Dict[str, Any]:
+    rows = session.execute(instructor_dashboard_query(instructor_id)).all()
+    stats = rows[0]
+
+    return {
+        "overview": {
+            "total_courses": stats.total_courses,
+            "published_courses": stats.published_courses,
+            "total_students": stats.total_students,
+            "total_lessons": stats.total_lessons,
+            "average_rating": (
+                round(stats.rating_sum / stats.rating_count, 2)
+                if stats.rating_count else 0.0
+            )
+        },
+        "recent_enrollments": [
+            {
+                "student_email": row.student_email,
+                "course_title": row.course_title,
+                "enrolled_at": row.enrolled_at,
+                "progress": row.progress
+            }
+            for row in rows
+            if row.enrollment_id is not None
+        ]
+    }
+
+
+# Loaders for analytics_cache: refreshes run on a pool thread, after the
+# request's session is gone, so each opens a session of its own
+
+
+def load_instructor_dashboard(instructor_id: str) -> Dict[str, Any]:
+    with get_db_session() as session:
+        return get_instructor_dashboard(session, instructor_id)
+
+
+def load_course_analytics(course_id: str) -> Dict[str, Any]:
+    """Raises LookupError if the course no longer exists"""
+    with get_db_session() as session:
+        course = session.get(Course, course_id)
+        if course is None:
+            raise LookupError(course_id)
+        return get_course_analytics(session, course)
+
+
+def load_course_timeseries(course_id: str, start: date, end: date) -> List[Dict]:
+    with get_db_session() as session:
+        return course_timeseries(session, course_id, start, end)
@@ -0,0 +1,313 @@
+# backend/app/services/catalog.py
+from sqlmodel import Session, select, func
+from sqlalchemy import case, literal, or_, union_all
+from app.models import Course, Category, User, Profile, Lesson, Review
+from app.schemas import (
+    CourseRead, UserRead, CategoryRead, CourseFacets, FacetBucket,
+    CoursePage, LessonOutline, InstructorProfile, RatingSummary
+)
+from app.core.conditional import make_etag
+from app.services import search as course_search
+from typing import List, Optional
+
+# (value, label, upper bound) - upper bounds are exclusive, None = open ended
+PRICE_BUCKETS = (
+    ("free", "Free", None),
+    ("under_20", "Under $20", 20),
+    ("20_50", "$20 - $50", 50),
+    ("50_100", "$50 - $100", 100),
+    ("100_plus", "$100+", None),
+)
+
+
+def course_rows_query(include_description: bool = True):
+    """Base statement for catalog rows: course columns plus instructor/category.
+
+    Callers add their own filters, ordering and pagination; the joins keep
+    the instructor and category lookups in the same round trip, and counts
+    come from the denormalized counters on the course row itself. Plain
+    columns are selected rather than entities so rows skip ORM identity-map
+    and attribute instrumentation overhead. List views that don't show the
+    (potentially long) description can leave it out entirely.
+    """
+    description = [Course.description] if include_description else []
+    return (
+        select(
+            Course.id,
+            Course.title,
+            *description,
+            Course.image,
+            Course.price,
+            Course.is_published,
+            Course.instructor_id,
+            Course.category_id,
+            Course.created_at,
+            Course.updated_at,
+            Course.lessons_count,
+            Course.enrollments_count,
+            Course.rating_sum,
+            Course.rating_count,
+            User.email.label("instructor_email"),
+            User.role.label("instructor_role"),
+            User.created_at.label("instructor_created_at"),
+            User.updated_at.label("instructor_updated_at"),
+            Category.name.label("category_name"),
+        )
+        .join(User, Course.instructor_id == User.id)
+        .outerjoin(Category, Course.category_id == Category.id)
+    )
+
+
+def filter_courses(
+    session: Session,
+    query,
+    search: Optional[str] = None,
+    category_id: Optional[str] = None,
+    instructor_id: Optional[str] = None,
+    published_only: bool = True,
+    rank: bool = True
+):
+    """Apply the catalog filters shared by listings and facets"""
+
+    # Public endpoints show published courses only by default
+    if published_only:
+        query = query.where(Course.is_published == True)
+
+    if search:
+        # Full-text match on title/description, most relevant first
+        query = course_search.apply_search(session, query, search, rank=rank)
+
+    if category_id:
+        query = query.where(Course.category_id == category_id)
+
+    if instructor_id:
+        query = query.where(Course.instructor_id == instructor_id)
+
+    return query
+
+
+def price_bucket_expression():
+    whens = [(or_(Course.price == None, Course.price <= 0), PRICE_BUCKETS[0][0])]
+    whens += [
+        (Course.price < upper, value)
+        for value, _, upper in PRICE_BUCKETS[1:] if upper is not None
+    ]
+    return case(*whens, else_=PRICE_BUCKETS[-1][0])
+
+
+def get_course_facets(
+    session: Session,
+    search: Optional[str] = None,
+    category_id: Optional[str] = None,
+    instructor_id: Optional[str] = None
+) -> CourseFacets:
+    """Published-course counts per category, price bucket and instructor.
+
+    One statement: a UNION ALL of grouped selects. Each facet ignores its own
+    filter so the client can show the alternatives next to the active choice
+    (counts per category while a category is selected, and so on).
+    """
+    def filtered(query, **skip):
+        filters = dict(search=search, category_id=category_id,
+                       instructor_id=instructor_id)
+        filters.update(skip)
+        return filter_courses(session, query, rank=False, **filters)
+
+    price_bucket = price_bucket_expression()
+
+    total = filtered(
+        select(literal("total"), literal(None), literal(None),
+               func.count(Course.id))
+        .select_from(Course)
+    )
+    categories = filtered(
+        select(literal("category"), Course.category_id, Category.name,
+               func.count(Course.id))
+        .select_from(Course)
+        .outerjoin(Category, Course.category_id == Category.id)
+        .group_by(Course.category_id, Category.name),
+        category_id=None
+    )
+    prices = filtered(
+        select(literal("price"), price_bucket, literal(None),
+               func.count(Course.id))
+        .select_from(Course)
+        .group_by(price_bucket)
+    )
+    instructors = filtered(
+        select(literal("instructor"), Course.instructor_id, Profile.name,
+               func.count(Course.id))
+        .select_from(Course)
+        .outerjoin(Profile, Profile.user_id == Course.instructor_id)
+        .group_by(Course.instructor_id, Profile.name),
+        instructor_id=None
+    )
+
+    facets = {"total": 0, "category": [], "price": {}, "instructor": []}
+    for facet, value, label, count in session.execute(
+            union_all(total, categories, prices, instructors)):
+        if facet == "total":
+            facets["total"] = count
+        elif facet == "price":
+            facets["price"][value] = count
+        else:
+            facets[facet].append(
+                FacetBucket(value=value, label=label or "", count=count))
+
+    def by_count(bucket):
+        return (-bucket.count, bucket.label)
+
+    return CourseFacets(
+        total=facets["total"],
+        categories=sorted(facets["category"], key=by_count),
+        price=[
+            FacetBucket(value=value, label=label,
+                        count=facets["price"].get(value, 0))
+            for value, label, _ in PRICE_BUCKETS
+        ],
+        instructors=sorted(facets["instructor"], key=by_count),
+    )
+
+
+def average_rating(course) -> float:
+    """Average rating from a course's rating_sum/rating_count counters"""
+    if not course.rating_count:
+        return 0.0
+    return round(course.rating_sum / course.rating_count, 2)
+
+
+def build_course_read(row) -> CourseRead:
+    """CourseRead from a `course_rows_query()` row"""
+    return CourseRead(
+        id=row.id,
+        title=row.title,
+        description=getattr(row, "description", None),
+        image=row.image,
+        price=row.price,
+        is_published=row.is_published,
+        instructor_id=row.instructor_id,
+        category_id=row.category_id,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        instructor=UserRead(
+            id=row.instructor_id,
+            email=row.instructor_email,
+            role=row.instructor_role,
+            created_at=row.instructor_created_at,
+            updated_at=row.instructor_updated_at
+        ),
+        category=CategoryRead(
+            id=row.category_id,
+            name=row.category_name
+        ) if row.category_id else None,
+        lessons_count=row.lessons_count,
+        enrollments_count=row.enrollments_count,
+        reviews_count=row.rating_count,
+        average_rating=average_rating(row)
+    )
+
+
+def get_course_reads(session: Session, statement) -> List[CourseRead]:
+    """Run a `course_rows_query()` statement and build full CourseRead objects"""
+    return [build_course_read(row) for row in session.execute(statement)]
+
+
+def get_course_reads_by_ids(
+    session: Session,
+    course_ids: List[str]
+) -> List[Optional[CourseRead]]:
+    """Resolve many courses with one `IN (...)` query.
+
+    Results follow the order of `course_ids` (duplicates included), with None
+    where a course doesn't exist.
+    """
+    if not course_ids:
+        return []
+
+    course_reads = get_course_reads(
+        session,
+        course_rows_query().where(Course.id.in_(set(course_ids)))
+    )
+    by_id = {course_read.id: course_read for course_read in course_reads}
+    return [by_id.get(course_id) for course_id in course_ids]
+
+
+def get_course_read(session: Session, course_id: str) -> Optional[CourseRead]:
+    """Single-course variant of `get_course_reads`; None if it doesn't exist."""
+    course_reads = get_course_reads(
+        session, course_rows_query().where(Course.id == course_id)
+    )
+    return course_reads[0] if course_reads else None
+
+
+def outline_query(course_id: str):
+    """Lesson titles and order only - the `content` column is never read"""
+    return (
+        select(Lesson.id, Lesson.title, Lesson.video_url, Lesson.order)
+        .where(Lesson.course_id == course_id)
+        .order_by(Lesson.order)
+    )
+
+
+def rating_distribution(session: Session, course_id: str) -> dict:
+    counts = dict(session.execute(
+        select(Review.rating, func.count(Review.id))
+        .where(Review.course_id == course_id)
+        .group_by(Review.rating)
+    ).all())
+    return {f"{stars}_star": counts.get(stars, 0) for stars in range(5, 0, -1)}
+
+
+def get_course_page(session: Session, course_id: str) -> Optional[CoursePage]:
+    """Course, lesson outline, instructor profile and rating summary.
+
+    Always three queries: the catalog row joined with the instructor profile,
+    the outline, and the rating histogram.
+    """
+    row = session.execute(
+        course_rows_query()
+        .add_columns(Profile.name.label("instructor_name"),
+                     Profile.bio.label("instructor_bio"),
+                     Profile.avatar.label("instructor_avatar"))
+        .outerjoin(Profile, Profile.user_id == Course.instructor_id)
+        .where(Course.id == course_id)
+    ).first()
+    if row is None:
+        return None
+
+    outline = [
+        LessonOutline(id=lesson.id, title=lesson.title,
+                      video_url=lesson.video_url, order=lesson.order)
+        for lesson in session.execute(outline_query(course_id))
+    ]
+
+    return CoursePage(
+        course=build_course_read(row),
+        outline=outline,
+        instructor=InstructorProfile(
+            user_id=row.instructor_id,
+            name=row.instructor_name,
+            bio=row.instructor_bio,
+            avatar=row.instructor_avatar
+        ),
+        rating=RatingSummary(
+            average_rating=average_rating(row),
+            total_reviews=row.rating_count,
+            rating_distribution=rating_distribution(session, course_id)
+        )
+    )
+
+
+def course_etag(course_read: CourseRead) -> str:
+    """ETag over everything a CourseRead shows, including the counters"""
+    return make_etag(
+        course_read.id,
+        course_read.updated_at.isoformat(),
+        course_read.lessons_count,
+        course_read.enrollments_count,
+        course_read.reviews_count,
+        course_read.average_rating,
+        course_read.category.name if course_read.category else None,
+        course_read.instructor.email if course_read.instructor else None,
+        course_read.instructor.role.value if course_read.instructor else None,
+    )
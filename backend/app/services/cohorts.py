@@ -0,0 +1,203 @@
+# backend/app/services/cohorts.py
+from sqlmodel import Session, select, func
+from sqlalchemy import or_, text
+from app.core.cache import invalidate
+from app.core.database import dialect_insert
+from app.models import Enrollment, User
+from app.schemas import CohortEnrollmentResult
+from app.services.access import user_access_tag
+from app.services.counters import bump_course_counters
+from app.services.daily_stats import bump_daily_stats
+from datetime import datetime
+from typing import Dict, Iterable, List, Set, Tuple
+import csv
+import io
+import uuid
+
+MAX_COHORT_SIZE = 50000
+# From this many identifiers on, Postgres loads them with COPY into a temp
+# table and does the resolve + insert server-side in one statement
+COPY_THRESHOLD = 5000
+RESOLVE_CHUNK_SIZE = 10000
+# Ids/emails echoed back in the response when they match no user
+MAX_UNKNOWN_REPORTED = 100
+
+CSV_HEADERS = {"email", "student_id", "user_id", "id"}
+
+
+def normalize_identifiers(
+    student_ids: Iterable[str],
+    emails: Iterable[str]
+) -> Tuple[Set[str], Set[str]]:
+    """Deduplicated ids and lowercased emails, blanks dropped"""
+    ids = {value.strip() for value in student_ids if value.strip()}
+    addresses = {value.strip().lower() for value in emails if value.strip()}
+    return ids, addresses
+
+
+def parse_cohort_csv(data: bytes) -> Tuple[List[str], List[str]]:
+    """Read ids/emails from an uploaded CSV: every non-empty cell counts.
+
+    Cells containing "@" are treated as emails, anything else as a student
+    id; a header row (email, student_id, ...) is skipped.
+    """
+    student_ids, emails = [], []
+    reader = csv.reader(io.StringIO(data.decode("utf-8-sig")))
+    for row_number, row in enumerate(reader):
+        cells = [cell.strip() for cell in row if cell.strip()]
+        if row_number == 0 and cells and all(
+                cell.lower() in CSV_HEADERS for cell in cells):
+            continue
+        for cell in cells:
+            (emails if "@" in cell else student_ids).append(cell)
+    return student_ids, emails
+
+
+def enroll_cohort(
+    session: Session,
+    course_id: str,
+    student_ids: Set[str],
+    emails: Set[str]
+) -> CohortEnrollmentResult:
+    """Enroll every resolvable student in a course, skipping existing ones.
+
+    Users are resolved with one query and all missing enrollments inserted
+    with one bulk INSERT ... ON CONFLICT DO NOTHING (the unique
+    student/course index makes it safe against concurrent enrollments).
+    Counters and cache invalidation are queued in the same transaction; the
+    caller commits.
+    """
+    if (session.get_bind().dialect.name == "postgresql"
+            and len(student_ids) + len(emails) >= COPY_THRESHOLD):
+        created_ids, resolved, unknown = _enroll_via_copy(
+            session, course_id, student_ids, emails)
+    else:
+        created_ids, resolved, unknown = _enroll_via_values(
+            session, course_id, student_ids, emails)
+
+    if created_ids:
+        bump_course_counters(
+            session, course_id, enrollments_count=len(created_ids))
+        bump_daily_stats(session, course_id, new_enrollments=len(created_ids))
+        invalidate(session, f"course:{course_id}",
+                   *(user_access_tag(student_id) for student_id in created_ids))
+
+    return CohortEnrollmentResult(
+        created=len(created_ids),
+        skipped=resolved - len(created_ids),
+        unknown=len(unknown),
+        unknown_identifiers=sorted(unknown)[:MAX_UNKNOWN_REPORTED]
+    )
+
+
+def _enroll_via_values(
+    session: Session,
+    course_id: str,
+    student_ids: Set[str],
+    emails: Set[str]
+):
+    # A single query up to RESOLVE_CHUNK_SIZE identifiers (SQLite caps the
+    # number of bound parameters; Postgres switches to COPY well before)
+    users: Dict[str, str] = {}
+    ids, addresses = sorted(student_ids), sorted(emails)
+    for start in range(0, max(len(ids), len(addresses)), RESOLVE_CHUNK_SIZE):
+        id_chunk = ids[start:start + RESOLVE_CHUNK_SIZE]
+        email_chunk = addresses[start:start + RESOLVE_CHUNK_SIZE]
+        users.update(session.exec(
+            select(User.id, func.lower(User.email)).where(
+                or_(User.id.in_(id_chunk),
+                    func.lower(User.email).in_(email_chunk)))
+        ).all())
+
+    unknown = (student_ids - users.keys()) | (emails - set(users.values()))
+    if not users:
+        return [], 0, unknown
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "student_id": student_id,
+            "course_id": course_id,
+            "progress": 0.0,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for student_id in users
+    ]
+    # Sent as multi-row VALUES batches (insertmanyvalues), RETURNING only the
+    # rows that were actually inserted
+    created_ids = session.execute(
+        dialect_insert(session, Enrollment)
+        .on_conflict_do_nothing(index_elements=["student_id", "course_id"])
+        .returning(Enrollment.student_id),
+        rows
+    ).scalars().all()
+    return created_ids, len(users), unknown
+
+
+def _copy_escape(value: str) -> str:
+    """Escape a value for COPY's text format"""
+    return (value.replace("\\", "\\\\")
+            .replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def _enroll_via_copy(
+    session: Session,
+    course_id: str,
+    student_ids: Set[str],
+    emails: Set[str]
+):
+    """Postgres path for large cohorts: COPY the identifiers, then one INSERT"""
+    connection = session.connection()
+    connection.execute(text(
+        "CREATE TEMP TABLE cohort_input (identifier text, is_email boolean) "
+        "ON COMMIT DROP"
+    ))
+
+    buffer = io.StringIO()
+    for value in student_ids:
+        buffer.write(f"{_copy_escape(value)}\tf\n")
+    for value in emails:
+        buffer.write(f"{_copy_escape(value)}\tt\n")
+    buffer.seek(0)
+    # psycopg2 cursor on the session's own connection/transaction
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(
+            "COPY cohort_input (identifier, is_email) FROM STDIN", buffer)
+
+    connection.execute(text("ANALYZE cohort_input"))
+    # Two equi-joins rather than one OR join, so both can be hash joins
+    connection.execute(text(
+        "CREATE TEMP TABLE cohort_matches ON COMMIT DROP AS "
+        "SELECT i.identifier, i.is_email, u.id AS student_id "
+        'FROM cohort_input i JOIN "user" u ON u.id = i.identifier '
+        "WHERE NOT i.is_email "
+        "UNION "
+        "SELECT i.identifier, i.is_email, u.id "
+        'FROM cohort_input i JOIN "user" u ON lower(u.email) = i.identifier '
+        "WHERE i.is_email"
+    ))
+    resolved = connection.execute(text(
+        "SELECT count(DISTINCT student_id) FROM cohort_matches")).scalar_one()
+
+    created_ids = connection.execute(
+        text(
+            "INSERT INTO enrollment "
+            "(id, student_id, course_id, progress, completed_lessons_count, "
+            "created_at, updated_at) "
+            "SELECT gen_random_uuid()::text, student_id, :course_id, 0, 0, "
+            ":now, :now FROM (SELECT DISTINCT student_id FROM cohort_matches) m "
+            "ON CONFLICT (student_id, course_id) DO NOTHING "
+            "RETURNING student_id"
+        ),
+        {"course_id": course_id, "now": datetime.utcnow()}
+    ).scalars().all()
+
+    unknown = connection.execute(text(
+        "SELECT i.identifier FROM cohort_input i WHERE NOT EXISTS ("
+        "SELECT 1 FROM cohort_matches m "
+        "WHERE m.identifier = i.identifier AND m.is_email = i.is_email)"
+    )).scalars().all()
+
+    return created_ids, resolved, unknown
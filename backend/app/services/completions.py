@@ -0,0 +1,155 @@
+# backend/app/services/completions.py
+from sqlmodel import Session, select, func
+from sqlalchemy import case, delete, literal, update
+from app.core.database import dialect_insert
+from app.models import Course, Enrollment, Lesson, LessonCompletion
+from app.schemas import CompletionResult
+from app.services.analytics import COMPLETED_PROGRESS
+from app.services.daily_stats import bump_daily_stats, completed_at_update
+from datetime import datetime
+from typing import List
+
+
+def course_progress(completed_count):
+    """Progress (0-100) for a completed-lesson count, from the course counter"""
+    lessons_count = (
+        select(Course.lessons_count)
+        .where(Course.id == Enrollment.course_id)
+        .scalar_subquery()
+    )
+    ratio = case(
+        (lessons_count > 0, completed_count * 100.0 / lessons_count),
+        else_=0.0
+    )
+    return case((ratio > 100.0, 100.0), else_=ratio)
+
+
+def complete_lessons(
+    session: Session,
+    enrollment_id: str,
+    course_id: str,
+    lesson_ids: List[str]
+) -> CompletionResult:
+    """Mark lessons of the enrollment's course complete and update its progress.
+
+    Lesson ids from other courses are ignored and repeats are no-ops. The
+    enrollment's completed count is bumped by the number of rows actually
+    inserted and progress set from it and course.lessons_count, in the same
+    transaction, without rescanning completions or lessons. From then on the
+    enrollment's progress is the completion ratio (see recompute_progress).
+    Reaching 100% for the first time counts towards the course's daily
+    completions. The caller commits.
+    """
+    now = datetime.utcnow()
+    source = select(
+        literal(enrollment_id), Lesson.id, literal(now), literal(now)
+    ).where(Lesson.course_id == course_id, Lesson.id.in_(set(lesson_ids)))
+    inserted = len(session.execute(
+        dialect_insert(session, LessonCompletion)
+        .from_select(
+            ["enrollment_id", "lesson_id", "created_at", "updated_at"], source)
+        .on_conflict_do_nothing(index_elements=["enrollment_id", "lesson_id"])
+        .returning(LessonCompletion.lesson_id)
+    ).all())
+
+    if inserted:
+        completed = Enrollment.completed_lessons_count + inserted
+        progress = course_progress(completed)
+        statement = (
+            update(Enrollment)
+            .where(Enrollment.id == enrollment_id)
+            .values(
+                completed_lessons_count=completed,
+                progress=progress,
+                completed_at=completed_at_update(
+                    progress >= COMPLETED_PROGRESS, now)
+            )
+            .returning(Enrollment.completed_lessons_count, Enrollment.progress,
+                       Enrollment.completed_at)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        statement = select(
+            Enrollment.completed_lessons_count, Enrollment.progress,
+            Enrollment.completed_at
+        ).where(Enrollment.id == enrollment_id)
+    completed_count, progress, completed_at = session.execute(statement).one()
+    if inserted and completed_at == now:
+        bump_daily_stats(session, course_id, now.date(), completions=1)
+
+    return CompletionResult(
+        completed=inserted,
+        completed_lessons_count=completed_count,
+        progress=progress
+    )
+
+
+def remove_completions_for_lessons(session: Session, lesson_ids: List[str]):
+    """Delete completions of removed lessons, keeping completed counts right.
+
+    Call it before the lessons go and follow up with recompute_progress once
+    lessons_count has been bumped. The caller commits.
+    """
+    if not lesson_ids:
+        return
+    removed = (
+        select(func.count())
+        .where(LessonCompletion.enrollment_id == Enrollment.id,
+               LessonCompletion.lesson_id.in_(lesson_ids))
+        .scalar_subquery()
+    )
+    completed = Enrollment.completed_lessons_count - removed
+    session.execute(
+        update(Enrollment)
+        .where(Enrollment.id.in_(
+            select(LessonCompletion.enrollment_id)
+            .where(LessonCompletion.lesson_id.in_(lesson_ids))))
+        .values(
+            completed_lessons_count=completed,
+            # Right for enrollments left without completions, which
+            # recompute_progress no longer touches; the rest follow there
+            progress=course_progress(completed),
+            updated_at=Enrollment.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    session.execute(
+        delete(LessonCompletion).where(LessonCompletion.lesson_id.in_(lesson_ids)))
+
+
+def recompute_progress(session: Session, course_id: str) -> int:
+    """Re-derive progress of the course's enrollments after lessons_count moved.
+
+    Enrollments with completed lessons track completed/lessons_count: adding
+    a lesson lowers their progress (4/4 becomes 4/5) and removing one can
+    raise it. Call it right after bump_course_counters in the same
+    transaction. Enrollments without completions keep the value reported
+    through PUT /courses/{id}/progress, which only applies to those (see
+    update_course_progress). completed_at records when the course was first
+    completed and isn't cleared when progress drops below 100; enrollments
+    reaching 100% for the first time count towards today's completions.
+    Returns the number of enrollments updated. The caller commits.
+    """
+    now = datetime.utcnow()
+    progress = course_progress(Enrollment.completed_lessons_count)
+    rows = session.execute(
+        update(Enrollment)
+        .where(Enrollment.course_id == course_id,
+               Enrollment.completed_lessons_count > 0)
+        .values(
+            progress=progress,
+            completed_at=completed_at_update(
+                progress >= COMPLETED_PROGRESS, now),
+            updated_at=Enrollment.updated_at)
+        .returning(Enrollment.completed_at)
+        .execution_options(synchronize_session=False)
+    ).all()
+    completions = sum(1 for completed_at, in rows if completed_at == now)
+    if completions:
+        bump_daily_stats(session, course_id, now.date(), completions=completions)
+    return len(rows)
+
+
+def remove_completions_for_enrollment(session: Session, enrollment_id: str):
+    session.execute(
+        delete(LessonCompletion)
+        .where(LessonCompletion.enrollment_id == enrollment_id))
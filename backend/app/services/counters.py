@@ -0,0 +1,87 @@
+# backend/app/services/counters.py
+from sqlmodel import Session, select, func
+from sqlalchemy import update, or_
+from app.models import Course, Lesson, Enrollment, Review
+from typing import Iterable, Optional, Sequence
+
+COUNTER_FIELDS = ("lessons_count", "enrollments_count",
+                  "rating_sum", "rating_count")
+
+
+def bump_course_counters(
+    session: Session,
+    course_id: str,
+    returning: Sequence = (),
+    **deltas: int
+):
+    """Apply relative changes to a course's denormalized counters.
+
+    Issued as `SET x = x + :delta` so concurrent writers never lose updates.
+    Call it before the write's commit so the counter moves in the same
+    transaction as the row it counts, e.g.
+
+        bump_course_counters(session, course_id, enrollments_count=1)
+        bump_course_counters(session, course_id, rating_count=1, rating_sum=5)
+
+    Course columns listed in `returning` come back from the same UPDATE
+    (None if nothing was bumped or the course doesn't exist).
+    """
+    values = {
+        field: getattr(Course, field) + delta
+        for field, delta in deltas.items()
+        if field in COUNTER_FIELDS and delta
+    }
+    if not values:
+        return None
+
+    # Counters are not edits: keep updated_at from firing its onupdate
+    statement = (
+        update(Course)
+        .where(Course.id == course_id)
+        .values(updated_at=Course.updated_at, **values)
+    )
+    if not returning:
+        session.execute(statement)
+        return None
+    return session.execute(statement.returning(*returning)).first()
+
+
+def actual_counts():
+    """Correlated subqueries computing each counter from the source tables"""
+    return {
+        "lessons_count": select(func.count(Lesson.id))
+        .where(Lesson.course_id == Course.id)
+        .scalar_subquery(),
+        "enrollments_count": select(func.count(Enrollment.id))
+        .where(Enrollment.course_id == Course.id)
+        .scalar_subquery(),
+        "rating_sum": select(func.coalesce(func.sum(Review.rating), 0))
+        .where(Review.course_id == Course.id)
+        .scalar_subquery(),
+        "rating_count": select(func.count(Review.id))
+        .where(Review.course_id == Course.id)
+        .scalar_subquery(),
+    }
+
+
+def reconcile_course_counters(
+    session: Session,
+    course_ids: Optional[Iterable[str]] = None
+) -> int:
+    """Recompute counters from source rows and fix any drift.
+
+    Only rows whose stored values disagree are rewritten. Returns the number of
+    courses that were corrected. The caller commits.
+    """
+    counts = actual_counts()
+    drifted = or_(*(getattr(Course, field) != counts[field]
+                    for field in COUNTER_FIELDS))
+
+    statement = update(Course).where(drifted).values(
+        updated_at=Course.updated_at, **counts)
+    if course_ids is not None:
+        statement = statement.where(Course.id.in_(list(course_ids)))
+
+    result = session.execute(
+        statement.execution_options(synchronize_session=False))
+    return result.rowcount
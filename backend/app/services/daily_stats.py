@@ -0,0 +1,98 @@
+# backend/app/services/daily_stats.py
+from sqlmodel import Session, select
+from sqlalchemy import and_, case
+from app.core.database import dialect_insert
+from app.models import CourseDailyStats, Enrollment
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+DAILY_STATS_FIELDS = ("new_enrollments", "unenrollments", "completions",
+                      "review_count", "review_sum")
+
+
+def bump_daily_stats(
+    session: Session,
+    course_id: str,
+    day: Optional[date] = None,
+    **deltas: int
+) -> None:
+    """Add to a course's counts for a day (default: today, UTC).
+
+    A single upsert (INSERT ... ON CONFLICT DO UPDATE SET x = x + :delta),
+    so concurrent writers never lose increments. Call it before the write's
+    commit, like bump_course_counters, e.g.
+
+        bump_daily_stats(session, course_id, new_enrollments=1)
+        bump_daily_stats(session, course_id, review_count=1, review_sum=5)
+    """
+    values = {
+        field: delta
+        for field, delta in deltas.items()
+        if field in DAILY_STATS_FIELDS and delta
+    }
+    if not values:
+        return
+
+    statement = dialect_insert(session, CourseDailyStats).values(
+        course_id=course_id, day=day or datetime.utcnow().date(), **values)
+    session.execute(statement.on_conflict_do_update(
+        index_elements=["course_id", "day"],
+        set_={
+            field: getattr(CourseDailyStats, field)
+            + getattr(statement.excluded, field)
+            for field in values
+        }
+    ))
+
+
+def completed_at_update(reached, now: datetime):
+    """SET value for Enrollment.completed_at in a progress UPDATE.
+
+    `reached` is the SQL condition for the row's new progress being 100.
+    Stamps `now` the first time it holds; the caller compares the returned
+    completed_at with `now` to know whether to count a completion.
+    """
+    return case(
+        (and_(Enrollment.completed_at.is_(None), reached), now),
+        else_=Enrollment.completed_at
+    )
+
+
+def course_timeseries(
+    session: Session,
+    course_id: str,
+    start: date,
+    end: date
+) -> List[Dict]:
+    """Daily counts for start..end (inclusive) from the rollup table only.
+
+    Days without activity have no row and are filled in with zeros.
+    """
+    rows = {
+        row.day: row
+        for row in session.exec(
+            select(CourseDailyStats).where(
+                CourseDailyStats.course_id == course_id,
+                CourseDailyStats.day >= start,
+                CourseDailyStats.day <= end
+            )
+        ).all()
+    }
+
+    points = []
+    day = start
+    while day <= end:
+        row = rows.get(day)
+        review_count = row.review_count if row else 0
+        points.append({
+            "date": day,
+            "new_enrollments": row.new_enrollments if row else 0,
+            "unenrollments": row.unenrollments if row else 0,
+            "completions": row.completions if row else 0,
+            "review_count": review_count,
+            "average_rating": (
+                round(row.review_sum / review_count, 2) if review_count else None
+            ),
+        })
+        day += timedelta(days=1)
+    return points
@@ -0,0 +1,38 @@
+# backend/app/services/enrollments.py
+from sqlmodel import Session, select
+from sqlalchemy import literal
+from app.core.database import dialect_insert
+from app.models import Course, Enrollment
+from datetime import datetime
+import uuid
+
+ENROLLMENT_COLUMNS = (
+    "id", "student_id", "course_id", "progress", "created_at", "updated_at")
+
+
+def insert_enrollment(session: Session, student_id: str, course_id: str):
+    """Enroll a student in a published course with a single statement.
+
+    INSERT ... SELECT FROM course ... ON CONFLICT DO NOTHING RETURNING: the
+    course existence/published check, the duplicate check and the insert
+    happen atomically, so concurrent requests can't create two rows. Returns
+    the new (id, created_at), or None when nothing was inserted (course
+    missing or unpublished, or already enrolled).
+    """
+    now = datetime.utcnow()
+    source = select(
+        literal(str(uuid.uuid4())),
+        literal(student_id),
+        Course.id,
+        literal(0.0),
+        literal(now),
+        literal(now),
+    ).where(Course.id == course_id, Course.is_published == True)
+
+    statement = (
+        dialect_insert(session, Enrollment)
+        .from_select(ENROLLMENT_COLUMNS, source)
+        .on_conflict_do_nothing(index_elements=["student_id", "course_id"])
+        .returning(Enrollment.id, Enrollment.created_at)
+    )
+    return session.execute(statement).first()
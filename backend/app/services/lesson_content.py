@@ -0,0 +1,137 @@
+# backend/app/services/lesson_content.py
+from sqlmodel import Session, select
+from sqlalchemy import LargeBinary, cast, func
+from app.core.database import get_db_session
+from app.models import Lesson
+from app.models.types import CODEC_ZLIB, HEADER_SIZE, read_header
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional
+import logging
+import zlib
+
+logger = logging.getLogger(__name__)
+
+# Each chunk is its own short query, so a slow client never pins a pooled
+# connection for the length of the download
+CHUNK_SIZE = 256 * 1024
+
+
+@dataclass
+class ContentInfo:
+    updated_at: datetime
+    # Length of the UTF-8 body as served to the client
+    size: int
+    compressed: bool
+
+
+def stored_bytes():
+    """The raw stored value of Lesson.content, bypassing decompression"""
+    # A no-op on Postgres bytea; on SQLite it also covers TEXT rows written
+    # before compression
+    return cast(Lesson.content, LargeBinary)
+
+
+def get_content_info(
+    session: Session,
+    course_id: str,
+    lesson_id: str
+) -> Optional[ContentInfo]:
+    """Look up a lesson body's size and format without reading the body"""
+    raw = stored_bytes()
+    row = session.exec(
+        select(
+            Lesson.updated_at,
+            func.length(raw),
+            func.substr(raw, 1, HEADER_SIZE, type_=LargeBinary)
+        )
+        .where(Lesson.id == lesson_id, Lesson.course_id == course_id)
+    ).first()
+    if not row:
+        return None
+
+    updated_at, stored_size, head = row
+    header = read_header(bytes(head or b""))
+    if header is None:
+        return ContentInfo(updated_at, stored_size or 0, compressed=False)
+    codec, size = header
+    if codec != CODEC_ZLIB:
+        raise ValueError(f"Unknown content codec {codec!r}")
+    return ContentInfo(updated_at, size, compressed=True)
+
+
+def read_chunk(
+    session: Session,
+    lesson_id: str,
+    updated_at: datetime,
+    offset: int,
+    size: int
+) -> Optional[bytes]:
+    """Read `size` stored bytes at `offset`, or None if the lesson changed"""
+    # substr() is 1-based in both Postgres and SQLite
+    chunk = session.exec(
+        select(func.substr(stored_bytes(), offset + 1, size,
+                           type_=LargeBinary))
+        .where(Lesson.id == lesson_id, Lesson.updated_at == updated_at)
+    ).first()
+    return None if chunk is None else bytes(chunk)
+
+
+def stored_chunks(
+    lesson_id: str,
+    updated_at: datetime,
+    offset: int,
+    end: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield stored bytes from `offset` up to `end` (inclusive, None = all).
+
+    Runs after the request's own session is closed, so every chunk opens a
+    fresh one. If the lesson is edited mid-stream the iteration stops early
+    rather than mixing two versions.
+    """
+    while end is None or offset <= end:
+        size = chunk_size if end is None else min(chunk_size, end - offset + 1)
+        with get_db_session() as session:
+            chunk = read_chunk(session, lesson_id, updated_at, offset, size)
+        if chunk is None:
+            logger.warning(f"Lesson {lesson_id} changed while streaming, aborting")
+            return
+        if not chunk:
+            return
+        yield chunk
+        offset += len(chunk)
+
+
+def stream_content(
+    lesson_id: str,
+    info: ContentInfo,
+    start: int,
+    end: int,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield bytes start..end (inclusive) of a lesson body chunk by chunk.
+
+    Plain bodies are sliced in the database. Compressed bodies are read
+    sequentially and inflated incrementally, so memory stays at about one
+    chunk either way; a range deep into a compressed body still has to
+    inflate (but not keep) everything before it. A truncated stream shows
+    up as a Content-Length mismatch, telling the client to retry.
+    """
+    if not info.compressed:
+        yield from stored_chunks(
+            lesson_id, info.updated_at, start, end, chunk_size)
+        return
+
+    inflater = zlib.decompressobj()
+    position = 0
+    for chunk in stored_chunks(lesson_id, info.updated_at, HEADER_SIZE,
+                               chunk_size=chunk_size):
+        data = inflater.decompress(chunk, chunk_size)
+        while data:
+            if position + len(data) > start:
+                yield data[max(start - position, 0):end - position + 1]
+            position += len(data)
+            if position > end:
+                return
+            data = inflater.decompress(inflater.unconsumed_tail, chunk_size)
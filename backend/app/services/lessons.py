@@ -0,0 +1,173 @@
+# backend/app/services/lessons.py
+from sqlmodel import Session, select, func
+from sqlalchemy import delete, insert, update
+from app.models import Lesson
+from app.schemas import LessonBatch, LessonBatchResult, LessonOutline
+from app.services.counters import bump_course_counters
+from app.services.completions import (
+    recompute_progress, remove_completions_for_lessons)
+from datetime import datetime
+from typing import List, Optional
+import uuid
+
+# Lessons are ordered by sparse integer keys. New lessons are appended one
+# step apart, and a move takes the midpoint of its new neighbours, so a
+# single row changes. Only when two neighbours end up adjacent (after ~10
+# moves into the same gap) is the course renumbered.
+ORDER_STEP = 1024
+
+
+def max_order(session: Session, course_id: str) -> int:
+    return session.exec(
+        select(func.coalesce(func.max(Lesson.order), 0))
+        .where(Lesson.course_id == course_id)
+    ).one()
+
+
+def renumber_lessons(session: Session, course_id: str) -> None:
+    """Spread a course's lesson order keys back out to ORDER_STEP apart"""
+    lesson_ids = session.exec(
+        select(Lesson.id)
+        .where(Lesson.course_id == course_id)
+        .order_by(Lesson.order, Lesson.created_at)
+    ).all()
+    session.execute(
+        update(Lesson),
+        [
+            {"id": lesson_id, "order": (index + 1) * ORDER_STEP}
+            for index, lesson_id in enumerate(lesson_ids)
+        ]
+    )
+
+
+def apply_lesson_batch(
+    session: Session,
+    course_id: str,
+    batch: LessonBatch
+) -> LessonBatchResult:
+    """Delete, update and create lessons of one course as a single unit of work.
+
+    Each kind of change is one statement (executemany for updates and
+    inserts). The caller commits; nothing is written if it raises. Update
+    ids must belong to the course; unknown delete ids are ignored.
+    """
+    deleted = 0
+    if batch.delete:
+        delete_ids = session.exec(
+            select(Lesson.id).where(
+                Lesson.course_id == course_id,
+                Lesson.id.in_(batch.delete)
+            )
+        ).all()
+        # Before the lessons go, so completed counts are adjusted first
+        remove_completions_for_lessons(session, delete_ids)
+        deleted = session.execute(
+            delete(Lesson).where(Lesson.id.in_(delete_ids))
+        ).rowcount
+
+    updates = [
+        item.model_dump(exclude_unset=True) for item in batch.update
+    ]
+    if updates:
+        update_ids = {item["id"] for item in updates}
+        found = set(session.exec(
+            select(Lesson.id).where(
+                Lesson.course_id == course_id,
+                Lesson.id.in_(update_ids)
+            )
+        ).all())
+        missing = update_ids - found
+        if missing:
+            raise LookupError(sorted(missing))
+        now = datetime.utcnow()
+        # ORM bulk UPDATE by primary key: rows are grouped by the set of
+        # columns they change and sent as executemany
+        session.execute(
+            update(Lesson),
+            [dict(item, updated_at=now) for item in updates]
+        )
+
+    created: List[LessonOutline] = []
+    if batch.create:
+        now = datetime.utcnow()
+        next_order = None
+        rows = []
+        for item in batch.create:
+            order = item.order
+            if order is None:
+                if next_order is None:
+                    next_order = max_order(session, course_id)
+                next_order += ORDER_STEP
+                order = next_order
+            rows.append({
+                "id": str(uuid.uuid4()),
+                "course_id": course_id,
+                "title": item.title,
+                "content": item.content,
+                "video_url": item.video_url,
+                "order": order,
+                "created_at": now,
+                "updated_at": now,
+            })
+        session.execute(insert(Lesson), rows)
+        created = [
+            LessonOutline(id=row["id"], title=row["title"],
+                          video_url=row["video_url"], order=row["order"])
+            for row in rows
+        ]
+
+    bump_course_counters(
+        session, course_id, lessons_count=len(created) - deleted)
+    if created or deleted:
+        recompute_progress(session, course_id)
+
+    return LessonBatchResult(
+        created=created, updated=len(updates), deleted=deleted)
+
+
+def move_lesson(
+    session: Session,
+    lesson: Lesson,
+    after_id: Optional[str] = None
+) -> Lesson:
+    """Give `lesson` an order key between `after_id` and its successor.
+
+    Usually a single-row update; renumbers the course first when there is
+    no integer gap left between the two neighbours. Raises LookupError if
+    `after_id` is not a lesson of the same course.
+    """
+    def neighbours():
+        previous = 0
+        if after_id is not None:
+            previous = session.exec(
+                select(Lesson.order).where(
+                    Lesson.id == after_id,
+                    Lesson.course_id == lesson.course_id
+                )
+            ).first()
+            if previous is None:
+                raise LookupError(after_id)
+        following = session.exec(
+            select(func.min(Lesson.order)).where(
+                Lesson.course_id == lesson.course_id,
+                Lesson.order > previous,
+                Lesson.id != lesson.id
+            )
+        ).one()
+        return previous, following
+
+    if after_id == lesson.id:
+        return lesson
+
+    previous, following = neighbours()
+    if following is not None and following - previous < 2:
+        renumber_lessons(session, lesson.course_id)
+        session.expire(lesson)
+        previous, following = neighbours()
+
+    if following is None:
+        lesson.order = previous + ORDER_STEP
+    else:
+        lesson.order = (previous + following) // 2
+    session.add(lesson)
+    return lesson
@@ -0,0 +1,135 @@
+# backend/app/services/progress.py
+from sqlalchemy import case, tuple_, update
+from app.core.config import settings
+from app.core.database import get_db_session
+from app.models import Enrollment
+from app.services.analytics import COMPLETED_PROGRESS
+from app.services.daily_stats import bump_daily_stats, completed_at_update
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Rows per UPDATE statement when flushing
+FLUSH_BATCH_SIZE = 500
+
+
+class ProgressBuffer:
+    """Coalesces progress reports in memory and writes them in batches.
+
+    Only the highest reported value per (student_id, course_id) is kept, and
+    the flush UPDATE never lowers a stored value, so progress can't go
+    backwards even if reports arrive out of order. Like the synchronous PUT,
+    reports leave enrollments with completed lessons to the completion ratio.
+    A flush happens every `interval` seconds, as soon as `max_pending`
+    enrollments are waiting, and on shutdown. Progress reported in the last interval before a crash is
+    lost; the next report from the player restores it. Enrollments reaching
+    100% for the first time are counted in the course's daily completions.
+    """
+
+    def __init__(self, interval: float, max_pending: int):
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, student_id: str, course_id: str, progress: float) -> None:
+        """Record a report (the stored value is only known after the flush)"""
+        progress = min(max(progress, 0.0), 100.0)
+        key = (student_id, course_id)
+        with self._lock:
+            progress = max(progress, self._pending.get(key, 0.0))
+            self._pending[key] = progress
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """Write all pending progress; returns the number of rows updated"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        items = list(pending.items())
+        updated = 0
+        try:
+            with get_db_session() as session:
+                now = datetime.utcnow()
+                completions = Counter()
+                for start in range(0, len(items), FLUSH_BATCH_SIZE):
+                    batch = items[start:start + FLUSH_BATCH_SIZE]
+                    new_progress = case(
+                        *(
+                            ((Enrollment.student_id == student_id)
+                             & (Enrollment.course_id == course_id)
+                             & (Enrollment.completed_lessons_count == 0)
+                             & (Enrollment.progress < progress), progress)
+                            for (student_id, course_id), progress in batch
+                        ),
+                        else_=Enrollment.progress
+                    )
+                    # Only rows reported at 100% can become completed
+                    reached = tuple_(Enrollment.student_id, Enrollment.course_id).in_(
+                        [key for key, progress in batch
+                         if progress >= COMPLETED_PROGRESS]
+                    ) & (Enrollment.completed_lessons_count == 0)
+                    result = session.execute(
+                        update(Enrollment)
+                        .where(tuple_(Enrollment.student_id, Enrollment.course_id)
+                               .in_([key for key, _ in batch]))
+                        .values(progress=new_progress, updated_at=now,
+                                completed_at=completed_at_update(reached, now))
+                        .returning(Enrollment.course_id, Enrollment.completed_at)
+                        .execution_options(synchronize_session=False)
+                    ).all()
+                    updated += len(result)
+                    completions.update(
+                        course_id for course_id, completed_at in result
+                        if completed_at == now)
+                for course_id, count in completions.items():
+                    bump_daily_stats(session, course_id, now.date(),
+                                     completions=count)
+                session.commit()
+        except Exception as e:
+            # Put the reports back (unless newer ones arrived) and retry later
+            logger.error(f"Progress flush failed, will retry: {e}")
+            with self._lock:
+                for key, progress in items:
+                    self._pending[key] = max(progress, self._pending.get(key, 0.0))
+            return 0
+
+        logger.info(f"Flushed progress for {len(items)} enrollment(s)")
+        return updated
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="progress-buffer-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the flush thread and write whatever is still pending"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5)
+            self._thread = None
+        self.flush()
+
+
+progress_buffer = ProgressBuffer(
+    settings.PROGRESS_FLUSH_INTERVAL, settings.PROGRESS_FLUSH_MAX_PENDING)
@@ -0,0 +1,100 @@
+# backend/app/services/search.py
+from sqlmodel import Session, select
+from sqlalchemy import func, literal_column, text
+from app.models import Course
+from typing import List
+import re
+
+# Postgres: the document is an expression over title/description backed by a
+# GIN expression index (see migration a4e2d8c61f07), so rows never need to be
+# re-indexed by the application. The expression must stay in sync with it.
+PG_SEARCH_DOCUMENT = literal_column(
+    "(setweight(to_tsvector('english'::regconfig, coalesce(course.title, '')), 'A')"
+    " || setweight(to_tsvector('english'::regconfig, coalesce(course.description, '')), 'B'))"
+)
+
+# SQLite: a standalone FTS5 table kept in sync by index_course/remove_course
+SQLITE_FTS_TABLE = "course_fts"
+
+MAX_SEARCH_TERMS = 8
+
+
+def search_terms(term: str) -> List[str]:
+    """Split user input into lowercase word tokens safe for both query syntaxes"""
+    return re.findall(r"\w+", term.lower())[:MAX_SEARCH_TERMS]
+
+
+def is_postgres(session: Session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def apply_search(session: Session, query, term: str, rank: bool = True):
+    """Restrict a course query to matches for `term`, ordered by relevance.
+
+    Every token is prefix-matched, so partial words typed into the search box
+    already return results ("pyth" finds "Python"). With `rank=False` only the
+    filter is applied (e.g. for aggregate queries).
+    """
+    terms = search_terms(term)
+    if not terms:
+        return query
+
+    if is_postgres(session):
+        ts_query = func.to_tsquery(
+            literal_column("'english'::regconfig"),
+            " & ".join(f"{t}:*" for t in terms)
+        )
+        query = query.where(PG_SEARCH_DOCUMENT.op("@@")(ts_query))
+        if rank:
+            query = query.order_by(
+                func.ts_rank_cd(PG_SEARCH_DOCUMENT, ts_query).desc())
+        return query
+
+    # bm25() ranks lower-is-better; title matches weigh ten times description
+    matches = (
+        select(
+            literal_column("course_id").label("course_id"),
+            literal_column(
+                f"bm25({SQLITE_FTS_TABLE}, 0.0, 10.0, 1.0)").label("rank")
+        )
+        .select_from(text(SQLITE_FTS_TABLE))
+        .where(
+            text(f"{SQLITE_FTS_TABLE} MATCH :fts_query").bindparams(
+                fts_query=" ".join(f'"{t}"*' for t in terms))
+        )
+        .subquery()
+    )
+    query = query.join(matches, matches.c.course_id == Course.id)
+    if rank:
+        query = query.order_by(matches.c.rank)
+    return query
+
+
+def index_course(session: Session, course: Course):
+    """Add or refresh a course in the search index (same transaction as the write)"""
+    if is_postgres(session):
+        return
+
+    remove_course(session, course.id)
+    session.execute(
+        text(
+            f"INSERT INTO {SQLITE_FTS_TABLE} (course_id, title, description) "
+            "VALUES (:course_id, :title, :description)"
+        ),
+        {
+            "course_id": course.id,
+            "title": course.title,
+            "description": course.description,
+        }
+    )
+
+
+def remove_course(session: Session, course_id: str):
+    """Drop a course from the search index"""
+    if is_postgres(session):
+        return
+
+    session.execute(
+        text(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE course_id = :course_id"),
+        {"course_id": course_id}
+    )
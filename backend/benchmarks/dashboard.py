@@ -0,0 +1,157 @@
+# backend/benchmarks/dashboard.py
+"""Statement count and latency of GET /api/instructor/dashboard.
+
+Seeds a scratch SQLite database with one instructor's courses, enrollments
+and reviews, then runs the previous six-statement dashboard and the current
+single CTE query. Asserts that both return the same payload and that the
+current one issues exactly one statement, so a regression fails loudly.
+
+Usage (from backend/): python -m benchmarks.dashboard
+"""
+from sqlalchemy import create_engine, event
+from sqlmodel import SQLModel, Session, select, func, and_
+from app.models import Course, Enrollment, Lesson, Review, User, UserRole
+from app.services.analytics import get_instructor_dashboard
+from app.services.counters import reconcile_course_counters
+from datetime import datetime, timedelta
+import os
+import random
+import tempfile
+import time
+
+COURSES = 50
+LESSONS_PER_COURSE = 20
+STUDENTS = 2000
+ENROLLMENTS_PER_STUDENT = 5
+ROUNDS = 50
+EXPECTED_STATEMENTS = 1
+
+
+def seed(engine) -> str:
+    rng = random.Random(42)
+    started = datetime(2026, 1, 1)
+    with Session(engine) as session:
+        instructor = User(email="instructor@example.com", password_hash="x",
+                          role=UserRole.INSTRUCTOR)
+        students = [User(email=f"student{i}@example.com", password_hash="x")
+                    for i in range(STUDENTS)]
+        session.add_all([instructor, *students])
+        session.flush()
+        courses = [
+            Course(title=f"Course {i}", description="...", price=10.0,
+                   is_published=i % 3 != 0, instructor_id=instructor.id)
+            for i in range(COURSES)
+        ]
+        session.add_all(courses)
+        session.flush()
+        session.add_all(
+            Lesson(title=f"Lesson {j}", content="...", order=j,
+                   course_id=course.id)
+            for course in courses for j in range(LESSONS_PER_COURSE)
+        )
+        for student in students:
+            for course in rng.sample(courses, ENROLLMENTS_PER_STUDENT):
+                session.add(Enrollment(
+                    student_id=student.id, course_id=course.id,
+                    progress=rng.choice([0.0, 35.0, 100.0]),
+                    created_at=started + timedelta(
+                        minutes=rng.randrange(60 * 24 * 300))))
+                if rng.random() < 0.2:
+                    session.add(Review(rating=rng.randint(1, 5), comment="",
+                                       student_id=student.id,
+                                       course_id=course.id))
+        session.flush()
+        reconcile_course_counters(session)
+        session.commit()
+        return instructor.id
+
+
+def previous_dashboard(session: Session, instructor_id: str):
+    """The dashboard as it was: six statements"""
+    total_courses = session.exec(
+        select(func.count(Course.id)).where(Course.instructor_id == instructor_id)
+    ).first()
+    published_courses = session.exec(
+        select(func.count(Course.id)).where(and_(
+            Course.instructor_id == instructor_id, Course.is_published == True))
+    ).first()
+    total_enrollments = session.exec(
+        select(func.count(Enrollment.id)).select_from(Enrollment).join(Course)
+        .where(Course.instructor_id == instructor_id)
+    ).first()
+    total_lessons = session.exec(
+        select(func.count(Lesson.id)).select_from(Lesson).join(Course)
+        .where(Course.instructor_id == instructor_id)
+    ).first()
+    avg_rating = session.exec(
+        select(func.avg(Review.rating)).select_from(Review).join(Course)
+        .where(Course.instructor_id == instructor_id)
+    ).first()
+    recent_enrollments = session.exec(
+        select(Enrollment, Course, User).select_from(Enrollment).join(Course)
+        .join(User, Enrollment.student_id == User.id)
+        .where(Course.instructor_id == instructor_id)
+        .order_by(Enrollment.created_at.desc()).limit(5)
+    ).all()
+    return {
+        "overview": {
+            "total_courses": total_courses or 0,
+            "published_courses": published_courses or 0,
+            "total_students": total_enrollments or 0,
+            "total_lessons": total_lessons or 0,
+            "average_rating": round(float(avg_rating), 2) if avg_rating else 0.0
+        },
+        "recent_enrollments": [
+            {
+                "student_email": user.email,
+                "course_title": course.title,
+                "enrolled_at": enrollment.created_at,
+                "progress": enrollment.progress
+            }
+            for enrollment, course, user in recent_enrollments
+        ]
+    }
+
+
+def measure(engine, func, instructor_id):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        with Session(engine) as session:
+            result = func(session, instructor_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    timings = []
+    for _ in range(ROUNDS):
+        with Session(engine) as session:
+            started = time.perf_counter()
+            func(session, instructor_id)
+            timings.append(time.perf_counter() - started)
+    return result, len(statements), min(timings)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'db.sqlite')}")
+        SQLModel.metadata.create_all(engine)
+        instructor_id = seed(engine)
+
+        before, before_count, before_time = measure(
+            engine, previous_dashboard, instructor_id)
+        after, after_count, after_time = measure(
+            engine, get_instructor_dashboard, instructor_id)
+
+        print(f"previous: {before_count} statements, {before_time * 1000:.2f} ms")
+        print(f"current:  {after_count} statements, {after_time * 1000:.2f} ms")
+
+        assert after == before, f"payload differs:\n{before}\n{after}"
+        assert after_count == EXPECTED_STATEMENTS, (
+            f"dashboard issued {after_count} statements, "
+            f"expected {EXPECTED_STATEMENTS}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# backend/benchmarks/lesson_storage.py
+"""Table size and read latency of lesson bodies, plain vs compressed.
+
+Builds two scratch SQLite databases with the same generated markdown-like
+lessons, one storing `content` as plain text (the previous AutoString
+column) and one through CompressedText, then compares file size, the time
+to read every body, and the time to read a single body.
+
+On Postgres, compare `SELECT pg_total_relation_size('lesson')` before and
+after the f47a2c9e8b13 migration instead; TOAST already applies pglz to
+large values, so the gain there is smaller than on SQLite.
+
+Usage (from backend/): python -m benchmarks.lesson_storage
+"""
+from sqlalchemy import (
+    Column, Integer, MetaData, String, Table, Text, create_engine, insert, select
+)
+from app.models.types import CompressedText
+import os
+import random
+import tempfile
+import time
+
+LESSONS = 2000
+WORDS_PER_LESSON = 1500
+ROUNDS = 5
+
+VOCABULARY = (
+    "the a of to and in is for this function returns value list python data "
+    "model query index example code lesson course student note\n ```python "
+    "def class import return self print ## ### - * `name` **important**"
+).split(" ")
+
+
+def make_bodies(n: int):
+    rng = random.Random(42)
+    return [
+        " ".join(rng.choice(VOCABULARY) for _ in range(WORDS_PER_LESSON))
+        for _ in range(n)
+    ]
+
+
+def build(path: str, content_type, bodies):
+    engine = create_engine(f"sqlite:///{path}")
+    table = Table(
+        "lesson", MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("title", String),
+        Column("content", content_type, nullable=False),
+    )
+    table.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(table), [
+            {"id": i, "title": f"Lesson {i}", "content": body}
+            for i, body in enumerate(bodies)
+        ])
+    return engine, table
+
+
+def best_of(func) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def measure(engine, table):
+    def read_all():
+        with engine.connect() as conn:
+            for _ in conn.execute(select(table.c.content)):
+                pass
+
+    def read_one():
+        with engine.connect() as conn:
+            for i in range(0, LESSONS, 10):
+                conn.execute(
+                    select(table.c.content).where(table.c.id == i)).scalar_one()
+
+    return best_of(read_all), best_of(read_one) / (LESSONS // 10)
+
+
+def main():
+    bodies = make_bodies(LESSONS)
+    raw_size = sum(len(body.encode()) for body in bodies)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, content_type in (("plain", Text), ("compressed", CompressedText)):
+            path = os.path.join(tmp, f"{label}.db")
+            engine, table = build(path, content_type, bodies)
+            read_all, read_one = measure(engine, table)
+            results[label] = (os.path.getsize(path), read_all, read_one)
+            engine.dispose()
+
+    print(f"{LESSONS} lessons, {raw_size / 1e6:.1f} MB of UTF-8 text")
+    for label, (size, read_all, read_one) in results.items():
+        print(f"  {label:<10} file {size / 1e6:7.2f} MB   "
+              f"read all {read_all * 1e3:7.1f} ms   "
+              f"read one {read_one * 1e6:7.1f} us")
+    plain, compressed = results["plain"], results["compressed"]
+    print(f"  size ratio: {plain[0] / compressed[0]:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
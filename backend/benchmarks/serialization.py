@@ -0,0 +1,133 @@
+# backend/benchmarks/serialization.py
+"""Per-item cost of serializing a GET /api/courses page (limit=100).
+
+Compares the previous path (CourseRead built from ORM entities, FastAPI
+response_model re-validation, jsonable_encoder, json.dumps) with the current
+one (CourseRead built once from plain column rows, a single pydantic-core dump
+to bytes). No database is involved: both paths start from equivalent
+in-memory rows.
+
+Usage (from backend/): python -m benchmarks.serialization
+"""
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from app.models import Course, Category, User, UserRole
+from app.schemas import CourseRead, UserRead, CategoryRead
+from app.services.catalog import build_course_read
+from app.core.responses import dump_json
+from collections import namedtuple
+from typing import List
+import timeit
+
+PAGE_SIZE = 100
+ROUNDS = 200
+
+
+def make_rows(n: int):
+    instructor = User(email="instructor@example.com", password_hash="x",
+                      role=UserRole.INSTRUCTOR)
+    category = Category(name="Programming")
+    return [
+        (
+            Course(
+                title=f"Course {i}",
+                description="A practical course. " * 20,
+                image=f"https://cdn.example.com/{i}.png",
+                price=19.99,
+                is_published=True,
+                instructor_id=instructor.id,
+                category_id=category.id,
+                lessons_count=12,
+                enrollments_count=340,
+                rating_sum=410,
+                rating_count=90,
+            ),
+            instructor,
+            category,
+        )
+        for i in range(n)
+    ]
+
+
+# Stand-in for the SQLAlchemy Row returned by course_rows_query()
+CatalogRow = namedtuple("CatalogRow", [
+    "id", "title", "description", "image", "price", "is_published",
+    "instructor_id", "category_id", "created_at", "updated_at",
+    "lessons_count", "enrollments_count", "rating_sum", "rating_count",
+    "instructor_email", "instructor_role", "instructor_created_at",
+    "instructor_updated_at", "category_name",
+])
+
+
+def to_catalog_rows(rows):
+    return [
+        CatalogRow(
+            course.id, course.title, course.description, course.image,
+            course.price, course.is_published, course.instructor_id,
+            course.category_id, course.created_at, course.updated_at,
+            course.lessons_count, course.enrollments_count,
+            course.rating_sum, course.rating_count,
+            instructor.email, instructor.role, instructor.created_at,
+            instructor.updated_at, category.name,
+        )
+        for course, instructor, category in rows
+    ]
+
+
+response_adapter = TypeAdapter(List[CourseRead])
+
+
+def old_path(rows) -> bytes:
+    course_reads = [
+        CourseRead(
+            id=course.id,
+            title=course.title,
+            description=course.description,
+            image=course.image,
+            price=course.price,
+            is_published=course.is_published,
+            instructor_id=course.instructor_id,
+            category_id=course.category_id,
+            created_at=course.created_at,
+            updated_at=course.updated_at,
+            instructor=UserRead(
+                id=instructor.id, email=instructor.email,
+                role=instructor.role, created_at=instructor.created_at,
+                updated_at=instructor.updated_at),
+            category=CategoryRead(id=category.id, name=category.name),
+            lessons_count=course.lessons_count,
+            enrollments_count=course.enrollments_count,
+        )
+        for course, instructor, category in rows
+    ]
+    # What FastAPI does with a response_model: validate again, dump, encode
+    validated = response_adapter.validate_python(
+        course_reads, from_attributes=True)
+    content = jsonable_encoder(response_adapter.dump_python(validated))
+    return JSONResponse(content).body
+
+
+def new_path(rows) -> bytes:
+    course_reads = [build_course_read(row) for row in rows]
+    return dump_json(course_reads, List[CourseRead])
+
+
+def per_item_us(func, rows) -> float:
+    seconds = min(timeit.repeat(lambda: func(rows), number=ROUNDS, repeat=5))
+    return seconds / ROUNDS / len(rows) * 1e6
+
+
+def main():
+    rows = make_rows(PAGE_SIZE)
+    before = per_item_us(old_path, rows)
+    after = per_item_us(new_path, to_catalog_rows(rows))
+
+    print(f"GET /api/courses?limit={PAGE_SIZE} serialization, per item")
+    print(f"  before (ORM entities, validate x2, jsonable_encoder): {before:8.2f} us")
+    print(f"  after  (column rows, validate once, dump_json):       {after:8.2f} us")
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
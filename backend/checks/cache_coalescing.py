@@ -0,0 +1,90 @@
+# backend/checks/cache_coalescing.py
+"""StaleWhileRevalidateCache: concurrent misses share one computation.
+
+Starts several `get_or_compute_async` calls for the same missing key at once
+and asserts that `compute` ran exactly once, that every caller got its
+result, and that the event loop kept serving other work while it ran (a
+ticker must advance during the computation). Then does the same for a miss
+arriving while a background refresh of the key is still running.
+
+Usage (from backend/): python -m checks.cache_coalescing
+"""
+from app.core.cache import StaleWhileRevalidateCache
+import asyncio
+import threading
+import time
+
+COMPUTE_SECONDS = 0.3
+CALLERS = 5
+
+
+def slow_compute(calls: list, value):
+    def compute():
+        calls.append(threading.current_thread().name)
+        time.sleep(COMPUTE_SECONDS)
+        return value
+    return compute
+
+
+async def ticker(ticks: list, stop: asyncio.Event):
+    while not stop.is_set():
+        ticks.append(time.monotonic())
+        await asyncio.sleep(0.01)
+
+
+async def gather_with_ticker(*calls):
+    ticks, stop = [], asyncio.Event()
+    task = asyncio.create_task(ticker(ticks, stop))
+    try:
+        results = await asyncio.gather(*calls)
+    finally:
+        stop.set()
+        await task
+    return results, ticks
+
+
+async def concurrent_misses():
+    cache = StaleWhileRevalidateCache("check", 10, ttl=60, max_stale=60)
+    calls = []
+    results, ticks = await gather_with_ticker(*(
+        cache.get_or_compute_async("key", slow_compute(calls, "value"), ["tag"])
+        for _ in range(CALLERS)
+    ))
+
+    assert len(calls) == 1, f"compute ran {len(calls)} times, expected once"
+    assert calls[0] != threading.main_thread().name, "computed on the event loop"
+    assert results == ["value"] * CALLERS, results
+    # ~30 ticks expected while computing; a blocked loop gives 1 or 2
+    assert len(ticks) > 10, f"event loop blocked ({len(ticks)} ticks)"
+    assert cache.stats()["coalesced"] == CALLERS - 1
+    print(f"concurrent misses: 1 computation for {CALLERS} callers, "
+          f"{len(ticks)} loop ticks meanwhile")
+
+
+async def miss_during_refresh():
+    cache = StaleWhileRevalidateCache("check", 10, ttl=0.05, max_stale=60)
+    calls = []
+    await cache.get_or_compute_async("key", slow_compute(calls, 1), ["tag"])
+    await asyncio.sleep(0.1)
+
+    # Stale hit: served at once, refresh starts on the pool
+    assert await cache.get_or_compute_async(
+        "key", slow_compute(calls, 2), ["tag"]) == 1
+    # The entry is dropped while the refresh runs; the next caller misses
+    cache.delete("key")
+    results, ticks = await gather_with_ticker(
+        cache.get_or_compute_async("key", slow_compute(calls, 3), ["tag"]))
+
+    assert results == [2], results
+    assert len(calls) == 2, f"compute ran {len(calls)} times, expected twice"
+    assert len(ticks) > 5, f"event loop blocked ({len(ticks)} ticks)"
+    print("miss during refresh: waited for the running refresh without blocking")
+
+
+def main():
+    asyncio.run(concurrent_misses())
+    asyncio.run(miss_during_refresh())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# backend/checks/dashboard_queries.py
+"""Instructor dashboard: one statement, right payload.
+
+Seeds a scratch SQLite database with a few courses of one instructor (and
+one course of another), counts the statements get_instructor_dashboard
+issues with a before_cursor_execute listener, and asserts there is exactly
+one and that the overview and recent enrollments match the seeded rows.
+benchmarks/dashboard.py measures the same query at scale; this is the quick
+version for `make check`.
+
+Usage (from backend/): python -m checks.dashboard_queries
+"""
+from sqlalchemy import create_engine, event
+from sqlmodel import SQLModel, Session
+from app.models import Course, Enrollment, Lesson, Review, User, UserRole
+from app.services.analytics import RECENT_ENROLLMENTS, get_instructor_dashboard
+from app.services.counters import reconcile_course_counters
+from datetime import datetime, timedelta
+import os
+import tempfile
+
+COURSES = 3
+STUDENTS = 4
+EXPECTED_STATEMENTS = 1
+
+
+def seed(engine):
+    started = datetime(2026, 1, 1)
+    with Session(engine) as session:
+        instructor, other = (
+            User(email=f"{name}@example.com", password_hash="x",
+                 role=UserRole.INSTRUCTOR)
+            for name in ("instructor", "other")
+        )
+        students = [User(email=f"student{i}@example.com", password_hash="x")
+                    for i in range(STUDENTS)]
+        session.add_all([instructor, other, *students])
+        session.flush()
+        courses = [
+            Course(title=f"Course {i}", description="...", price=10.0,
+                   is_published=i != 0, instructor_id=instructor.id)
+            for i in range(COURSES)
+        ]
+        foreign = Course(title="Other", description="...", price=10.0,
+                         is_published=True, instructor_id=other.id)
+        session.add_all([*courses, foreign])
+        session.flush()
+        session.add_all(
+            Lesson(title=f"Lesson {j}", content="...", order=j,
+                   course_id=course.id)
+            for course in courses for j in range(2)
+        )
+        # Every student in every course; the other instructor's enrollments
+        # are the newest, so they'd show first if the filter were lost
+        minute = 0
+        for course in [*courses, foreign]:
+            for student in students:
+                minute += 1
+                session.add(Enrollment(
+                    student_id=student.id, course_id=course.id,
+                    created_at=started + timedelta(minutes=minute)))
+        session.add_all([
+            Review(rating=5, comment="", student_id=students[0].id,
+                   course_id=courses[1].id),
+            Review(rating=2, comment="", student_id=students[1].id,
+                   course_id=courses[2].id),
+            Review(rating=1, comment="", student_id=students[0].id,
+                   course_id=foreign.id),
+        ])
+        session.flush()
+        reconcile_course_counters(session)
+        session.commit()
+        return instructor.id, courses[-1].title
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'db.sqlite')}")
+        SQLModel.metadata.create_all(engine)
+        instructor_id, newest_title = seed(engine)
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            with Session(engine) as session:
+                dashboard = get_instructor_dashboard(session, instructor_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+            engine.dispose()
+
+    assert len(statements) == EXPECTED_STATEMENTS, (
+        f"dashboard issued {len(statements)} statements, "
+        f"expected {EXPECTED_STATEMENTS}:\n" + "\n".join(statements))
+    assert dashboard["overview"] == {
+        "total_courses": COURSES,
+        "published_courses": COURSES - 1,
+        "total_students": COURSES * STUDENTS,
+        "total_lessons": COURSES * 2,
+        "average_rating": 3.5,
+    }, dashboard["overview"]
+    recent = dashboard["recent_enrollments"]
+    assert len(recent) == RECENT_ENROLLMENTS, recent
+    assert [row["enrolled_at"] for row in recent] == sorted(
+        (row["enrolled_at"] for row in recent), reverse=True), recent
+    assert recent[0]["course_title"] == newest_title, recent
+    print(f"instructor dashboard: {len(statements)} statement, "
+          f"{len(recent)} recent enrollments")
+
+
+if __name__ == "__main__":
+    main()
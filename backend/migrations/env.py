@@ -26,6 +26,16 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = SQLModel.metadata
 
+# Search structures are created by hand in migrations (GIN expression index on
+# Postgres, FTS5 virtual table on SQLite) and have no SQLModel counterpart
+SEARCH_OBJECTS = ("course_fts", "ix_course_search")
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if name and name.startswith(SEARCH_OBJECTS):
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -40,6 +50,7 @@ def run_migrations_offline():
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -53,7 +64,8 @@ def run_migrations_online():
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
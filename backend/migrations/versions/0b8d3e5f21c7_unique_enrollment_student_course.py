@@ -0,0 +1,49 @@
+"""unique enrollment student course
+
+Revision ID: 0b8d3e5f21c7
+Revises: f47a2c9e8b13
+Create Date: 2026-10-17 20:12:38.915274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b8d3e5f21c7'
+down_revision: Union[str, Sequence[str], None] = 'f47a2c9e8b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Collapse duplicate enrollments left by the old SELECT-then-INSERT race:
+    # keep the earliest row per (student, course) with the best progress
+    op.execute(
+        "UPDATE enrollment SET progress = ("
+        "SELECT max(e2.progress) FROM enrollment AS e2 "
+        "WHERE e2.student_id = enrollment.student_id "
+        "AND e2.course_id = enrollment.course_id)"
+    )
+    op.execute(
+        "DELETE FROM enrollment WHERE EXISTS ("
+        "SELECT 1 FROM enrollment AS e2 "
+        "WHERE e2.student_id = enrollment.student_id "
+        "AND e2.course_id = enrollment.course_id "
+        "AND (e2.created_at < enrollment.created_at "
+        "OR (e2.created_at = enrollment.created_at AND e2.id < enrollment.id)))"
+    )
+    op.execute(
+        "UPDATE course SET enrollments_count = ("
+        "SELECT count(*) FROM enrollment WHERE enrollment.course_id = course.id)"
+    )
+    op.create_index('uq_enrollment_student_id_course_id', 'enrollment', ['student_id', 'course_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_enrollment_student_id_course_id', table_name='enrollment')
@@ -0,0 +1,29 @@
+"""add enrollment activity index
+
+Revision ID: 1c6f4a9b7e20
+Revises: f90e02e8b6d5
+Create Date: 2026-10-17 21:48:09.226530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c6f4a9b7e20'
+down_revision: Union[str, Sequence[str], None] = 'f90e02e8b6d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_enrollment_student_id_updated_at_id', 'enrollment', ['student_id', 'updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_enrollment_student_id_updated_at_id', table_name='enrollment')
@@ -0,0 +1,33 @@
+"""add course fk indexes
+
+Revision ID: 3f1c9a7d2b64
+Revises: 959a4b311b43
+Create Date: 2026-10-17 09:12:40.215377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b64'
+down_revision: Union[str, Sequence[str], None] = '959a4b311b43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_lesson_course_id'), 'lesson', ['course_id'], unique=False)
+    op.create_index(op.f('ix_enrollment_course_id'), 'enrollment', ['course_id'], unique=False)
+    op.create_index(op.f('ix_review_course_id'), 'review', ['course_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_review_course_id'), table_name='review')
+    op.drop_index(op.f('ix_enrollment_course_id'), table_name='enrollment')
+    op.drop_index(op.f('ix_lesson_course_id'), table_name='lesson')
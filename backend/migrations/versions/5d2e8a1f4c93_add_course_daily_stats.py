@@ -0,0 +1,66 @@
+"""add course daily stats
+
+Revision ID: 5d2e8a1f4c93
+Revises: 1c6f4a9b7e20
+Create Date: 2026-10-17 22:41:12.308114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8a1f4c93'
+down_revision: Union[str, Sequence[str], None] = '1c6f4a9b7e20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('enrollment') as batch_op:
+        batch_op.add_column(sa.Column('completed_at', sa.DateTime(), nullable=True))
+    op.create_table('coursedailystats',
+    sa.Column('course_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('new_enrollments', sa.Integer(), nullable=False),
+    sa.Column('unenrollments', sa.Integer(), nullable=False),
+    sa.Column('completions', sa.Integer(), nullable=False),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('review_sum', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['course_id'], ['course.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('course_id', 'day')
+    )
+
+    # Completion time wasn't recorded so far: the last update of a finished
+    # enrollment is the best estimate
+    op.execute(
+        "UPDATE enrollment SET completed_at = updated_at "
+        "WHERE progress >= 100"
+    )
+    # Backfill from the rows that still exist. Past unenrollments deleted
+    # their enrollment and can't be recovered; they start counting now.
+    op.execute(
+        "INSERT INTO coursedailystats (course_id, day, new_enrollments, "
+        "unenrollments, completions, review_count, review_sum) "
+        "SELECT course_id, day, sum(new_enrollments), 0, sum(completions), "
+        "sum(review_count), sum(review_sum) FROM ("
+        "SELECT course_id, date(created_at) AS day, 1 AS new_enrollments, "
+        "0 AS completions, 0 AS review_count, 0 AS review_sum FROM enrollment "
+        "UNION ALL "
+        "SELECT course_id, date(completed_at), 0, 1, 0, 0 FROM enrollment "
+        "WHERE completed_at IS NOT NULL "
+        "UNION ALL "
+        "SELECT course_id, date(created_at), 0, 0, 1, rating FROM review"
+        ") activity WHERE course_id IS NOT NULL GROUP BY course_id, day"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('coursedailystats')
+    with op.batch_alter_table('enrollment') as batch_op:
+        batch_op.drop_column('completed_at')
@@ -0,0 +1,38 @@
+"""add keyset pagination indexes
+
+Revision ID: 7b5e0c94d1a3
+Revises: a4e2d8c61f07
+Create Date: 2026-10-17 13:41:05.870126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b5e0c94d1a3'
+down_revision: Union[str, Sequence[str], None] = 'a4e2d8c61f07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_course_is_published_created_at_id', 'course', ['is_published', 'created_at', 'id'], unique=False)
+    op.create_index('ix_course_created_at_id', 'course', ['created_at', 'id'], unique=False)
+    op.create_index('ix_enrollment_student_id_created_at_id', 'enrollment', ['student_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_enrollment_course_id_created_at_id', 'enrollment', ['course_id', 'created_at', 'id'], unique=False)
+    # Covered by the leading column of ix_enrollment_course_id_created_at_id
+    op.drop_index(op.f('ix_enrollment_course_id'), table_name='enrollment')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_enrollment_course_id'), 'enrollment', ['course_id'], unique=False)
+    op.drop_index('ix_enrollment_course_id_created_at_id', table_name='enrollment')
+    op.drop_index('ix_enrollment_student_id_created_at_id', table_name='enrollment')
+    op.drop_index('ix_course_created_at_id', table_name='course')
+    op.drop_index('ix_course_is_published_created_at_id', table_name='course')
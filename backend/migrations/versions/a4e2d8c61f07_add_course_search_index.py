@@ -0,0 +1,52 @@
+"""add course search index
+
+Revision ID: a4e2d8c61f07
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-17 11:03:18.552904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e2d8c61f07'
+down_revision: Union[str, Sequence[str], None] = '3f1c9a7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        # Must match PG_SEARCH_DOCUMENT in app/services/search.py
+        op.execute(
+            "CREATE INDEX ix_course_search ON course USING GIN ("
+            "(setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A')"
+            " || setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'B')))"
+        )
+    elif bind.dialect.name == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE course_fts USING fts5("
+            "course_id UNINDEXED, title, description, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "INSERT INTO course_fts (course_id, title, description) "
+            "SELECT id, title, description FROM course"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_course_search")
+    elif bind.dialect.name == "sqlite":
+        op.execute("DROP TABLE IF EXISTS course_fts")
@@ -0,0 +1,46 @@
+"""add course counters
+
+Revision ID: c82f4e1a9d35
+Revises: 7b5e0c94d1a3
+Create Date: 2026-10-17 15:20:47.319862
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c82f4e1a9d35'
+down_revision: Union[str, Sequence[str], None] = '7b5e0c94d1a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('course') as batch_op:
+        batch_op.add_column(sa.Column('lessons_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('enrollments_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from the source tables
+    op.execute(
+        "UPDATE course SET "
+        "lessons_count = (SELECT count(*) FROM lesson WHERE lesson.course_id = course.id), "
+        "enrollments_count = (SELECT count(*) FROM enrollment WHERE enrollment.course_id = course.id), "
+        "rating_sum = (SELECT coalesce(sum(rating), 0) FROM review WHERE review.course_id = course.id), "
+        "rating_count = (SELECT count(*) FROM review WHERE review.course_id = course.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('course') as batch_op:
+        batch_op.drop_column('rating_count')
+        batch_op.drop_column('rating_sum')
+        batch_op.drop_column('enrollments_count')
+        batch_op.drop_column('lessons_count')
@@ -0,0 +1,39 @@
+"""add category timestamps
+
+Revision ID: d19b7f3e6a08
+Revises: c82f4e1a9d35
+Create Date: 2026-10-17 17:08:52.604113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd19b7f3e6a08'
+down_revision: Union[str, Sequence[str], None] = 'c82f4e1a9d35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('category') as batch_op:
+        batch_op.add_column(sa.Column('created_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    op.execute("UPDATE category SET created_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP")
+
+    with op.batch_alter_table('category') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('category') as batch_op:
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('created_at')
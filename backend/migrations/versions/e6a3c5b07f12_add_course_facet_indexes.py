@@ -0,0 +1,33 @@
+"""add course facet indexes
+
+Revision ID: e6a3c5b07f12
+Revises: d19b7f3e6a08
+Create Date: 2026-10-17 19:32:11.048236
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a3c5b07f12'
+down_revision: Union[str, Sequence[str], None] = 'd19b7f3e6a08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_course_is_published_category_id', 'course', ['is_published', 'category_id'], unique=False)
+    op.create_index('ix_course_is_published_instructor_id', 'course', ['is_published', 'instructor_id'], unique=False)
+    op.create_index('ix_course_is_published_price', 'course', ['is_published', 'price'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_course_is_published_price', table_name='course')
+    op.drop_index('ix_course_is_published_instructor_id', table_name='course')
+    op.drop_index('ix_course_is_published_category_id', table_name='course')
@@ -0,0 +1,94 @@
+"""compress lesson content
+
+Revision ID: f47a2c9e8b13
+Revises: e6a3c5b07f12
+Create Date: 2026-10-17 19:05:12.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+from app.models.types import compress_text, decompress_text
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f47a2c9e8b13'
+down_revision: Union[str, Sequence[str], None] = 'e6a3c5b07f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+lesson = sa.table(
+    'lesson',
+    sa.column('id', sa.String()),
+    # Untyped: values are passed through exactly as the converters return them
+    sa.column('content'),
+)
+
+
+def rewrite_content(convert) -> None:
+    """Rewrite every lesson body through `convert`, BATCH_SIZE rows at a time.
+
+    Keyset-paginated on id so each batch is one indexed read and one
+    executemany UPDATE, and memory stays bounded on large tables.
+    """
+    bind = op.get_bind()
+    last_id = ''
+    while True:
+        rows = bind.execute(
+            sa.select(lesson.c.id, lesson.c.content)
+            .where(lesson.c.id > last_id)
+            .order_by(lesson.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        changed = []
+        for row in rows:
+            new_content = convert(row.content)
+            if new_content != row.content:
+                changed.append({'lesson_id': row.id, 'content': new_content})
+        if changed:
+            bind.execute(
+                lesson.update()
+                .where(lesson.c.id == sa.bindparam('lesson_id'))
+                .values(content=sa.bindparam('content')),
+                changed
+            )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column(
+            'lesson', 'content',
+            type_=sa.LargeBinary(),
+            postgresql_using="convert_to(content, 'UTF8')"
+        )
+    else:
+        # SQLite keeps existing TEXT values as they are; they still read
+        # because plain UTF-8 is a valid stored format
+        with op.batch_alter_table('lesson') as batch_op:
+            batch_op.alter_column('content', type_=sa.LargeBinary())
+
+    rewrite_content(lambda stored: compress_text(decompress_text(stored)))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        rewrite_content(lambda stored: decompress_text(stored).encode('utf-8'))
+        op.alter_column(
+            'lesson', 'content',
+            type_=sqlmodel.sql.sqltypes.AutoString(),
+            postgresql_using="convert_from(content, 'UTF8')"
+        )
+    else:
+        rewrite_content(decompress_text)
+        with op.batch_alter_table('lesson') as batch_op:
+            batch_op.alter_column('content', type_=sqlmodel.sql.sqltypes.AutoString())
@@ -0,0 +1,43 @@
+"""add lesson completions
+
+Revision ID: f90e02e8b6d5
+Revises: 0b8d3e5f21c7
+Create Date: 2026-10-17 21:02:44.517391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f90e02e8b6d5'
+down_revision: Union[str, Sequence[str], None] = '0b8d3e5f21c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('lessoncompletion',
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('enrollment_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('lesson_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.ForeignKeyConstraint(['enrollment_id'], ['enrollment.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['lesson_id'], ['lesson.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('enrollment_id', 'lesson_id')
+    )
+    op.create_index(op.f('ix_lessoncompletion_lesson_id'), 'lessoncompletion', ['lesson_id'], unique=False)
+    with op.batch_alter_table('enrollment') as batch_op:
+        batch_op.add_column(sa.Column('completed_lessons_count', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('enrollment') as batch_op:
+        batch_op.drop_column('completed_lessons_count')
+    op.drop_index(op.f('ix_lessoncompletion_lesson_id'), table_name='lessoncompletion')
+    op.drop_table('lessoncompletion')